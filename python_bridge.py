@@ -25,13 +25,23 @@ Communication Protocol:
 
 import sys
 import json
+import functools
 import traceback
 import importlib
 import importlib.util
 import os
+import types
+import weakref
 from pathlib import Path
 from typing import Any, Dict, Optional, List
 
+# Use orjson for the stdio framing when installed; the wire format stays JSON
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Try to import shared utilities (graceful fallback if not available)
 try:
     # Add the shared utilities path
@@ -64,6 +74,44 @@ except ImportError:
             return getattr(self.module, name)
 
 
+# Method discovery results per plugin class; weak keys let unloaded plugin
+# classes be collected
+_method_cache = weakref.WeakKeyDictionary()
+
+
+def _has_instance_callables(plugin) -> bool:
+    """Check whether a plugin instance carries public callables of its own."""
+    instance_attrs = getattr(plugin, '__dict__', {})
+    return any(callable(value) and not name.startswith('_')
+               for name, value in instance_attrs.items())
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_code(code: str):
+    """Compile a code payload once, as an expression if possible."""
+    try:
+        return compile(code, "<bridge>", "eval"), "eval"
+    except SyntaxError:
+        return compile(code, "<bridge>", "exec"), "exec"
+
+
+def _ok(request_id: Any, **fields: Any) -> Dict[str, Any]:
+    """Build a success response for the given request id."""
+    response = {"success": True}
+    response.update(fields)
+    response["id"] = request_id
+    return response
+
+
+def _err(request_id: Any, message: str, tb: Optional[str] = None) -> Dict[str, Any]:
+    """Build an error response for the given request id."""
+    response = {"success": False, "error": message}
+    if tb is not None:
+        response["traceback"] = tb
+    response["id"] = request_id
+    return response
+
+
 class PythonPluginBridge:
     """Main bridge class for handling Python plugin communication."""
 
@@ -71,63 +119,50 @@ class PythonPluginBridge:
         self.plugins = {}
         self.current_plugin = None
         self.plugin_modules = {}
+        # plugin_id -> {method name: bound method}, filled at load and on demand
+        self.method_tables = {}
         self.initialized = False
 
+        # Request type -> handler; each handler takes the full request dict
+        self._dispatch = {
+            "initialize": self._handle_initialize,
+            "load_plugin": self._handle_load_plugin,
+            "call_method": self._handle_call_method,
+            "get_plugin_info": self._handle_get_plugin_info,
+            "unload_plugin": self._handle_unload_plugin,
+            "shutdown": self._handle_shutdown,
+            "execute_code": self._handle_execute_code,
+        }
+
     def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle a request from the C++ side."""
         try:
             request_type = request.get("type", "")
-            request_id = request.get("id", 0)
-
-            if request_type == "initialize":
-                return self._handle_initialize(request_id)
-            elif request_type == "load_plugin":
-                return self._handle_load_plugin(request)
-            elif request_type == "call_method":
-                return self._handle_call_method(request)
-            elif request_type == "get_plugin_info":
-                return self._handle_get_plugin_info(request)
-            elif request_type == "unload_plugin":
-                return self._handle_unload_plugin(request)
-            elif request_type == "shutdown":
-                return self._handle_shutdown(request_id)
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown request type: {request_type}",
-                    "id": request_id
-                }
+            handler = self._dispatch.get(request_type)
+
+            if handler is None:
+                return _err(request.get("id", 0), f"Unknown request type: {request_type}")
+
+            return handler(request)
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Request handling error: {str(e)}",
-                "traceback": traceback.format_exc(),
-                "id": request.get("id", 0)
-            }
+            return _err(request.get("id", 0), f"Request handling error: {str(e)}",
+                        traceback.format_exc())
 
-    def _handle_initialize(self, request_id: int) -> Dict[str, Any]:
+    def _handle_initialize(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle initialization request."""
         self.initialized = True
-        return {
-            "success": True,
-            "message": "Python bridge initialized",
-            "id": request_id
-        }
+        return _ok(request.get("id", 0), message="Python bridge initialized")
 
     def _handle_load_plugin(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle plugin loading request."""
         plugin_path = request.get("plugin_path", "")
         plugin_class = request.get("plugin_class", "")
-        plugin_id = request.get("plugin_id")
+        plugin_id = request.get("plugin_id", request.get("plugin_name"))
+        plugin_source = request.get("plugin_source")
 
-        result = self.load_plugin(plugin_path, plugin_id)
+        result = self.load_plugin(plugin_path, plugin_id, plugin_source)
         result["id"] = request.get("id", 0)
-
-        if "error" not in result:
-            result["success"] = True
-        else:
-            result["success"] = False
-
+        result["success"] = "error" not in result
         return result
 
     def _handle_call_method(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -139,12 +174,7 @@ class PythonPluginBridge:
 
         result = self.call_method(plugin_id, method_name, params)
         result["id"] = request.get("id", 0)
-
-        if "error" not in result:
-            result["success"] = True
-        else:
-            result["success"] = False
-
+        result["success"] = "error" not in result
         return result
 
     def _handle_get_plugin_info(self, request: Dict[str, Any]) -> Dict[str, Any]:
@@ -152,20 +182,15 @@ class PythonPluginBridge:
         plugin_id = request.get("plugin_id", "")
 
         if plugin_id not in self.plugins:
-            return {
-                "success": False,
-                "error": f"Plugin not found: {plugin_id}",
-                "id": request.get("id", 0)
-            }
+            return _err(request.get("id", 0), f"Plugin not found: {plugin_id}")
 
         plugin_instance = self.plugins[plugin_id]
-        return {
-            "success": True,
-            "metadata": self._get_plugin_metadata(plugin_instance),
-            "methods": self._get_plugin_methods(plugin_instance),
-            "properties": self._get_plugin_properties(plugin_instance),
-            "id": request.get("id", 0)
-        }
+        return _ok(
+            request.get("id", 0),
+            metadata=self._get_plugin_metadata(plugin_instance),
+            methods=self._get_plugin_methods(plugin_instance),
+            properties=self._get_plugin_properties(plugin_instance)
+        )
 
     def _handle_unload_plugin(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle plugin unloading request."""
@@ -173,44 +198,62 @@ class PythonPluginBridge:
 
         if plugin_id in self.plugins:
             del self.plugins[plugin_id]
+            self.method_tables.pop(plugin_id, None)
             if plugin_id in self.plugin_modules:
                 del self.plugin_modules[plugin_id]
 
-        return {
-            "success": True,
-            "message": f"Plugin {plugin_id} unloaded",
-            "id": request.get("id", 0)
-        }
+        return _ok(request.get("id", 0), message=f"Plugin {plugin_id} unloaded")
 
-    def _handle_shutdown(self, request_id: int) -> Dict[str, Any]:
+    def _handle_shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle shutdown request."""
         self.plugins.clear()
+        self.method_tables.clear()
         self.plugin_modules.clear()
         self.initialized = False
 
-        return {
-            "success": True,
-            "message": "Python bridge shutdown",
-            "id": request_id
-        }
+        return _ok(request.get("id", 0), message="Python bridge shutdown")
+
+    def _handle_execute_code(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle code execution request."""
+        code = request.get("code", "")
+        namespace = dict(request.get("context") or {})
+
+        compiled, mode = _compile_code(code)
 
-    def load_plugin(self, plugin_path: str, plugin_id: Optional[str] = None) -> Dict[str, Any]:
-        """Load a Python plugin from the specified path."""
+        result = eval(compiled, namespace)
+        if mode == "exec":
+            # Statements report an explicit "result" binding, if any
+            result = namespace.get("result")
+
+        return _ok(request.get("id", 0), result=result)
+
+    def load_plugin(self, plugin_path: str, plugin_id: Optional[str] = None,
+                    plugin_source: Optional[str] = None) -> Dict[str, Any]:
+        """Load a Python plugin from the specified path or from source text."""
         try:
-            if not os.path.exists(plugin_path):
-                return {"error": f"Plugin file not found: {plugin_path}"}
+            if plugin_source is not None:
+                # Load the module straight from memory, without touching disk
+                if plugin_id is None:
+                    plugin_id = "plugin"
+
+                module = types.ModuleType(plugin_id)
+                code = compile(plugin_source, f"<{plugin_id}>", "exec")
+                exec(code, module.__dict__)
+            else:
+                if not os.path.exists(plugin_path):
+                    return {"error": f"Plugin file not found: {plugin_path}"}
 
-            # Generate plugin ID if not provided
-            if plugin_id is None:
-                plugin_id = Path(plugin_path).stem
+                # Generate plugin ID if not provided
+                if plugin_id is None:
+                    plugin_id = Path(plugin_path).stem
 
-            # Load the module
-            spec = importlib.util.spec_from_file_location(plugin_id, plugin_path)
-            if spec is None or spec.loader is None:
-                return {"error": f"Could not load plugin spec from {plugin_path}"}
+                # Load the module
+                spec = importlib.util.spec_from_file_location(plugin_id, plugin_path)
+                if spec is None or spec.loader is None:
+                    return {"error": f"Could not load plugin spec from {plugin_path}"}
 
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
 
             # Store the module
             self.plugin_modules[plugin_id] = module
@@ -241,11 +284,17 @@ class PythonPluginBridge:
                 if init_result is False:
                     return {"error": "Plugin initialization failed"}
 
+            methods = self._get_plugin_methods(plugin_instance)
+            self.method_tables[plugin_id] = {
+                method["name"]: getattr(plugin_instance, method["name"])
+                for method in methods
+            }
+
             return {
                 "success": True,
                 "plugin_id": plugin_id,
                 "metadata": self._get_plugin_metadata(plugin_instance),
-                "methods": self._get_plugin_methods(plugin_instance),
+                "methods": methods,
                 "properties": self._get_plugin_properties(plugin_instance)
             }
 
@@ -258,19 +307,21 @@ class PythonPluginBridge:
             if plugin_id not in self.plugins:
                 return {"error": f"Plugin not found: {plugin_id}"}
 
-            plugin = self.plugins[plugin_id]
-            if not hasattr(plugin, method_name):
-                return {"error": f"Method not found: {method_name}"}
+            method_table = self.method_tables.setdefault(plugin_id, {})
+            method = method_table.get(method_name)
+            if method is None:
+                # Not discovered at load time (e.g. delegated by __getattr__)
+                plugin = self.plugins[plugin_id]
+                if not hasattr(plugin, method_name):
+                    return {"error": f"Method not found: {method_name}"}
 
-            method = getattr(plugin, method_name)
-            if not callable(method):
-                return {"error": f"Attribute is not callable: {method_name}"}
+                method = getattr(plugin, method_name)
+                if not callable(method):
+                    return {"error": f"Attribute is not callable: {method_name}"}
+                method_table[method_name] = method
 
             # Call the method with parameters
-            if params is None:
-                params = []
-
-            result = method(*params)
+            result = method(*params) if params else method()
             return {"success": True, "result": result}
 
         except Exception as e:
@@ -313,6 +364,7 @@ class PythonPluginBridge:
 
             # Remove from storage
             del self.plugins[plugin_id]
+            self.method_tables.pop(plugin_id, None)
             if plugin_id in self.plugin_modules:
                 del self.plugin_modules[plugin_id]
 
@@ -326,12 +378,24 @@ class PythonPluginBridge:
 
     def _get_plugin_methods(self, plugin) -> List[Dict[str, Any]]:
         """Get list of callable methods from plugin."""
+        # Methods are defined by the class unless the instance adds its own
+        plugin_class = type(plugin)
+        cacheable = not _has_instance_callables(plugin)
+        if cacheable:
+            cached = _method_cache.get(plugin_class)
+            if cached is not None:
+                return list(cached)
+
         if SHARED_UTILS_AVAILABLE:
             # Use shared utilities for method discovery
-            return discover_plugin_methods_dict(plugin)
+            methods = discover_plugin_methods_dict(plugin)
         else:
             # Fallback to original implementation
-            return self._get_plugin_methods_original(plugin)
+            methods = self._get_plugin_methods_original(plugin)
+
+        if cacheable:
+            _method_cache[plugin_class] = methods
+        return list(methods)
 
     def _get_plugin_methods_original(self, plugin) -> List[Dict[str, Any]]:
         """Original method discovery implementation (fallback)."""
@@ -480,12 +544,40 @@ class PythonPluginBridge:
 # ModuleWrapper is now imported from shared utilities
 
 
+def _decode_message(line: str) -> Any:
+    """Decode one JSON request line."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # json also accepts NaN/Infinity and reports its own errors
+            pass
+    return json.loads(line)
+
+
+def _send_message(message: Dict[str, Any]) -> None:
+    """Encode a JSON response and write it as one line to stdout."""
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+        except (orjson.JSONEncodeError, TypeError):
+            # e.g. integers beyond 64 bits, which json serializes
+            data = None
+        if data is not None:
+            # Text a plugin printed must not land after the frame
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data + b"\n")
+            sys.stdout.buffer.flush()
+            return
+    print(json.dumps(message), flush=True)
+
+
 def main():
     """Main communication loop."""
     bridge = PythonPluginBridge()
 
     # Send ready signal
-    print(json.dumps({"ready": True}), flush=True)
+    _send_message({"ready": True})
 
     try:
         for line in sys.stdin:
@@ -494,27 +586,27 @@ def main():
                 continue
 
             try:
-                request = json.loads(line)
+                request = _decode_message(line)
 
                 # Use the new handle_request method
                 result = bridge.handle_request(request)
 
                 # Send response
-                print(json.dumps(result), flush=True)
+                _send_message(result)
 
             except json.JSONDecodeError as e:
                 error_response = {
                     "error": f"Invalid JSON: {str(e)}",
                     "id": 0
                 }
-                print(json.dumps(error_response), flush=True)
+                _send_message(error_response)
             except Exception as e:
                 error_response = {
                     "error": f"Unexpected error: {str(e)}",
                     "traceback": traceback.format_exc(),
                     "id": 0
                 }
-                print(json.dumps(error_response), flush=True)
+                _send_message(error_response)
 
     except KeyboardInterrupt:
         pass
@@ -523,7 +615,7 @@ def main():
             "error": f"Bridge error: {str(e)}",
             "traceback": traceback.format_exc()
         }
-        print(json.dumps(error_response), flush=True)
+        _send_message(error_response)
 
 
 if __name__ == '__main__':
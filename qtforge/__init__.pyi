@@ -37,6 +37,10 @@ def test_function() -> str:
     """Test function for verifying bindings work."""
     ...
 
+def test_function_batch(count: int) -> str:
+    """Run test_function's work count times in one call and return the last result."""
+    ...
+
 def get_build_info() -> Dict[str, Any]:
     """Get comprehensive build and system information."""
     ...
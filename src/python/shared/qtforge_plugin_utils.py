@@ -24,6 +24,7 @@ Design Principles:
 import json
 import inspect
 import sys
+import types
 from typing import Any, Dict, List, Optional, Union, Type
 from pathlib import Path
 
@@ -156,6 +157,78 @@ def extract_plugin_metadata(plugin_instance: Any, fallback_module: Any = None) -
     return metadata
 
 
+def _fast_signature(method: Any) -> Optional[tuple]:
+    """
+    Read a method's parameters straight from its code object.
+    
+    This avoids building inspect.Signature objects for plain Python functions
+    and bound methods. Wrapped functions, objects with a custom __signature__,
+    and non-Python callables return None so the caller can fall back to
+    inspect.signature.
+    
+    Args:
+        method: The method to analyze
+    
+    Returns:
+        Tuple of (parameters, return_type) in analyze_method_signature's
+        format, or None if the fast path does not apply
+    """
+    func = getattr(method, '__func__', method)
+    if (not isinstance(func, types.FunctionType) or hasattr(func, '__wrapped__')
+            or hasattr(func, '__signature__')):
+        return None
+    
+    code = func.__code__
+    names = code.co_varnames
+    pos_count = code.co_argcount
+    posonly_count = code.co_posonlyargcount
+    kwonly_count = code.co_kwonlyargcount
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    empty = inspect.Parameter.empty
+    
+    # (name, kind, default) in inspect.signature order
+    entries = []
+    first_default = pos_count - len(defaults)
+    for index, name in enumerate(names[:pos_count]):
+        kind = (inspect.Parameter.POSITIONAL_ONLY if index < posonly_count
+                else inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        default = defaults[index - first_default] if index >= first_default else empty
+        entries.append((name, kind, default))
+    
+    next_index = pos_count + kwonly_count
+    if code.co_flags & inspect.CO_VARARGS:
+        entries.append((names[next_index], inspect.Parameter.VAR_POSITIONAL, empty))
+        next_index += 1
+    for name in names[pos_count:pos_count + kwonly_count]:
+        entries.append((name, inspect.Parameter.KEYWORD_ONLY, kwdefaults.get(name, empty)))
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        entries.append((names[next_index], inspect.Parameter.VAR_KEYWORD, empty))
+    
+    if func is not method:
+        # Bound method: the first positional parameter is already bound
+        if pos_count == 0:
+            return None
+        entries.pop(0)
+    
+    annotations = func.__annotations__
+    parameters = []
+    for name, kind, default in entries:
+        if name == 'self':  # Skip 'self' parameter
+            continue
+        annotation = annotations.get(name, empty)
+        parameters.append({
+            "name": name,
+            "type": str(annotation) if annotation is not empty else "Any",
+            "default": str(default) if default is not empty else None,
+            "kind": str(kind)
+        })
+    
+    return_annotation = annotations.get('return', empty)
+    return_type = str(return_annotation) if return_annotation is not empty else "Any"
+    return parameters, return_type
+
+
 def analyze_method_signature(method: Any) -> MethodSignature:
     """
     Analyze a method's signature using Python's inspect module.
@@ -168,6 +241,12 @@ def analyze_method_signature(method: Any) -> MethodSignature:
     """
     method_name = getattr(method, '__name__', 'unknown_method')
     
+    fast = _fast_signature(method)
+    if fast is not None:
+        parameters, return_type = fast
+        docstring = getattr(method, '__doc__', '') or ''
+        return MethodSignature(method_name, parameters, return_type, docstring.strip())
+    
     try:
         sig = inspect.signature(method)
         parameters = []
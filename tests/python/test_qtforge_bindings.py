@@ -6,6 +6,8 @@ This test suite verifies that all QtForge Python bindings are working correctly.
 It tests basic functionality, module imports, and core operations.
 """
 
+import functools
+import re
 import unittest
 import sys
 import os
@@ -22,6 +24,24 @@ except ImportError:
         sys.path.insert(0, str(build_dir))
     import qtforge
 
+try:
+    from qtforge.core import (
+        PluginManager, PluginState, PluginCapability, PluginPriority,
+        Version, PluginMetadata, PluginLoadOptions
+    )
+    _HAS_CORE = True
+except ImportError:
+    _HAS_CORE = False
+
+_VERSION_RE = re.compile(r'\d+\.\d+\.\d+')
+
+
+@functools.lru_cache(maxsize=None)
+def available_modules() -> frozenset:
+    """Return the modules compiled into the bindings, fetched once."""
+    return frozenset(qtforge.list_available_modules())
+
+
 class TestQtForgeBasics(unittest.TestCase):
     """Test basic QtForge functionality."""
 
@@ -34,7 +54,7 @@ class TestQtForgeBasics(unittest.TestCase):
         """Test version information."""
         version = qtforge.get_version()
         self.assertIsInstance(version, str)
-        self.assertRegex(version, r'\d+\.\d+\.\d+')
+        self.assertRegex(version, _VERSION_RE)
 
         version_info = qtforge.get_version_info()
         self.assertIsInstance(version_info, tuple)
@@ -68,46 +88,23 @@ class TestQtForgeBasics(unittest.TestCase):
         self.assertIn("QtForge", help_text)
 
 
+@unittest.skipUnless(_HAS_CORE, "Core module not available")
 class TestQtForgeCoreModule(unittest.TestCase):
     """Test QtForge core module functionality."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        try:
-            from qtforge.core import (
-                PluginManager, PluginState, PluginCapability, PluginPriority,
-                Version, PluginMetadata, PluginLoadOptions
-            )
-            self.core_available = True
-            self.PluginManager = PluginManager
-            self.PluginState = PluginState
-            self.PluginCapability = PluginCapability
-            self.PluginPriority = PluginPriority
-            self.Version = Version
-            self.PluginMetadata = PluginMetadata
-            self.PluginLoadOptions = PluginLoadOptions
-        except ImportError:
-            self.core_available = False
-
     def test_core_module_import(self) -> None:
         """Test that core module can be imported."""
-        if not self.core_available:
-            self.skipTest("Core module not available")
-
         from qtforge import core
         self.assertIsNotNone(core)
 
     def test_plugin_states(self) -> None:
         """Test plugin state enumeration."""
-        if not self.core_available:
-            self.skipTest("Core module not available")
-
         states = [
-            self.PluginState.Unloaded,
-            self.PluginState.Loading,
-            self.PluginState.Loaded,
-            self.PluginState.Running,
-            self.PluginState.Error
+            PluginState.Unloaded,
+            PluginState.Loading,
+            PluginState.Loaded,
+            PluginState.Running,
+            PluginState.Error
         ]
 
         for state in states:
@@ -115,14 +112,11 @@ class TestQtForgeCoreModule(unittest.TestCase):
 
     def test_plugin_capabilities(self) -> None:
         """Test plugin capability enumeration."""
-        if not self.core_available:
-            self.skipTest("Core module not available")
-
         capabilities = [
-            self.PluginCapability.UI,
-            self.PluginCapability.Service,
-            self.PluginCapability.Network,
-            self.PluginCapability.Security
+            PluginCapability.UI,
+            PluginCapability.Service,
+            PluginCapability.Network,
+            PluginCapability.Security
         ]
 
         for capability in capabilities:
@@ -130,15 +124,12 @@ class TestQtForgeCoreModule(unittest.TestCase):
 
     def test_plugin_priorities(self) -> None:
         """Test plugin priority enumeration."""
-        if not self.core_available:
-            self.skipTest("Core module not available")
-
         priorities = [
-            self.PluginPriority.Lowest,
-            self.PluginPriority.Low,
-            self.PluginPriority.Normal,
-            self.PluginPriority.High,
-            self.PluginPriority.Highest
+            PluginPriority.Lowest,
+            PluginPriority.Low,
+            PluginPriority.Normal,
+            PluginPriority.High,
+            PluginPriority.Highest
         ]
 
         for priority in priorities:
@@ -146,11 +137,8 @@ class TestQtForgeCoreModule(unittest.TestCase):
 
     def test_version_creation(self) -> None:
         """Test version object creation and comparison."""
-        if not self.core_available:
-            self.skipTest("Core module not available")
-
-        v1 = self.Version(1, 0, 0)
-        v2 = self.Version(2, 0, 0)
+        v1 = Version(1, 0, 0)
+        v2 = Version(2, 0, 0)
 
         self.assertEqual(v1.major(), 1)
         self.assertEqual(v1.minor(), 0)
@@ -162,10 +150,7 @@ class TestQtForgeCoreModule(unittest.TestCase):
 
     def test_plugin_metadata(self) -> None:
         """Test plugin metadata creation."""
-        if not self.core_available:
-            self.skipTest("Core module not available")
-
-        metadata = self.PluginMetadata()
+        metadata = PluginMetadata()
         metadata.name = "TestPlugin"
         metadata.description = "A test plugin"
         metadata.author = "Test Author"
@@ -176,10 +161,7 @@ class TestQtForgeCoreModule(unittest.TestCase):
 
     def test_plugin_load_options(self) -> None:
         """Test plugin load options."""
-        if not self.core_available:
-            self.skipTest("Core module not available")
-
-        options = self.PluginLoadOptions()
+        options = PluginLoadOptions()
         options.validate_signature = True
         options.check_dependencies = False
 
@@ -188,10 +170,7 @@ class TestQtForgeCoreModule(unittest.TestCase):
 
     def test_plugin_manager_creation(self) -> None:
         """Test plugin manager creation."""
-        if not self.core_available:
-            self.skipTest("Core module not available")
-
-        manager = self.PluginManager()
+        manager = PluginManager()
         self.assertIsNotNone(manager)
 
         # Test basic operations
@@ -233,18 +212,15 @@ class TestQtForgeOptionalModules(unittest.TestCase):
             'monitoring', 'threading', 'transactions', 'composition', 'marketplace'
         ]
 
-        available_modules = qtforge.list_available_modules()
-
         for module_name in optional_modules:
-            if module_name in available_modules:
+            if module_name in available_modules():
                 try:
                     module = getattr(qtforge, module_name)
                     self.assertIsNotNone(module)
 
                     # Try to call test function if available
-                    test_func_name = f'test_{module_name}'
-                    if hasattr(module, test_func_name):
-                        test_func = getattr(module, test_func_name)
+                    test_func = getattr(module, f'test_{module_name}', None)
+                    if test_func is not None:
                         result = test_func()
                         self.assertIsInstance(result, str)
 
@@ -283,22 +259,9 @@ class TestQtForgeConvenienceFunctions(unittest.TestCase):
 
 def run_tests() -> None:
     """Run all tests and return results."""
-    # Create test suite
+    # Create test suite from every test class in this module
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add test classes
-    test_classes = [
-        TestQtForgeBasics,
-        TestQtForgeCoreModule,
-        TestQtForgeUtilsModule,
-        TestQtForgeOptionalModules,
-        TestQtForgeConvenienceFunctions
-    ]
-
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -325,22 +288,9 @@ def run_comprehensive_tests():
     print("🚀 Starting QtForge Python Bindings Comprehensive Test Suite")
     print("=" * 70)
 
-    # Create test suite
+    # Create test suite from every test class in this module
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-    # Add test classes
-    test_classes = [
-        TestQtForgeBasics,
-        TestQtForgeCore,
-        TestQtForgeUtils,
-        TestQtForgeOptionalModules,
-        TestQtForgeIntegration
-    ]
-
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)
@@ -574,6 +574,40 @@ class TestEdgeCases(unittest.TestCase):
         # The return type annotation for None can be represented differently
         self.assertIn(complex_method.return_type, ["None", "<class 'NoneType'>"])
 
+    def test_signature_fast_path_matches_inspect(self):
+        """Test code-object signature reading agrees with inspect.signature."""
+        import functools
+        import qtforge_plugin_utils
+
+        class SignaturePlugin:
+            def positional(self, a, b=2, *args, c, d=4, **kwargs) -> int:
+                return a
+
+            def annotated(self, x: int, y: str = "default") -> Dict[str, Any]:
+                return {"x": x, "y": y}
+
+            @staticmethod
+            def static(value, scale=1.0):
+                return value * scale
+
+            @classmethod
+            def factory(cls, name: str = None):
+                return cls()
+
+        plugin = SignaturePlugin()
+        callables = [plugin.positional, plugin.annotated, plugin.static,
+                     plugin.factory, functools.partial(plugin.annotated, 1), len]
+
+        fast_signature = qtforge_plugin_utils._fast_signature
+        for method in callables:
+            fast = analyze_method_signature(method).to_dict()
+            qtforge_plugin_utils._fast_signature = lambda method: None
+            try:
+                slow = analyze_method_signature(method).to_dict()
+            finally:
+                qtforge_plugin_utils._fast_signature = fast_signature
+            self.assertEqual(fast, slow)
+
     def test_backward_compatibility_edge_cases(self):
         """Test backward compatibility functions with edge cases."""
         class MinimalPlugin:
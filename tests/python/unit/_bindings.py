@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Locates the QtForge Python bindings for the unit tests.
+Puts the build directory on the Python path once, on first import.
+Shared by conftest.py and test_unit_runner.py.
+"""
+
+import os
+import sys
+
+BUILD_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '../../../build'))
+
+# Add the build directory to Python path for testing
+if BUILD_DIR not in sys.path:
+    sys.path.insert(0, BUILD_DIR)
+
+try:
+    import qtforge
+    BINDINGS_AVAILABLE = True
+except ImportError:
+    # Modules skip themselves; skipping here would abort the whole session
+    BINDINGS_AVAILABLE = False
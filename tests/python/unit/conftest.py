@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for QtForge Python bindings unit tests.
+Puts the build directory on the Python path once per session.
+"""
+
+# Imported for its side effect; see _bindings.py
+import _bindings  # noqa: F401
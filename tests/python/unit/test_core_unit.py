@@ -12,9 +12,6 @@ import json
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
-# Add the build directory to Python path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../build'))
-
 try:
     import qtforge
     import qtforge.core as core
@@ -4,6 +4,7 @@ Unit test runner for QtForge Python bindings.
 Runs all unit tests with comprehensive reporting and coverage analysis.
 """
 
+import io
 import pytest
 import sys
 import os
@@ -12,22 +13,16 @@ import subprocess
 from pathlib import Path
 from typing import List, Dict, Any
 
-# Add the build directory to Python path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../build'))
-
-try:
-    import qtforge
-    BINDINGS_AVAILABLE = True
-    print("✅ QtForge bindings are available")
-except ImportError as e:
-    BINDINGS_AVAILABLE = False
-    print(f"❌ QtForge bindings not available: {e}")
+# Shared with conftest.py: puts the build directory on the Python path
+from _bindings import BINDINGS_AVAILABLE
 
 
 class UnitTestRunner:
     """Comprehensive unit test runner for QtForge Python bindings."""
     
-    def __init__(self) -> None:
+    def __init__(self, stream: bool = False) -> None:
+        self.stream = stream
+        self._log = io.StringIO()
         self.test_dir = Path(__file__).parent
         self.test_modules = [
             "test_core_unit.py",
@@ -44,6 +39,21 @@ class UnitTestRunner:
         ]
         self.results = {}
     
+    def emit(self, line: str = "") -> None:
+        """Write a progress line, buffering it unless streaming is enabled."""
+        if self.stream:
+            print(line)
+        else:
+            self._log.write(line + "\n")
+    
+    def flush_output(self) -> None:
+        """Emit all buffered progress output in a single write."""
+        output = self._log.getvalue()
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+        self._log = io.StringIO()
+    
     def check_test_files(self) -> Dict[str, bool]:
         """Check which test files exist."""
         existing_tests = {}
@@ -57,16 +67,16 @@ class UnitTestRunner:
                 missing_tests.append(test_module)
         
         if missing_tests:
-            print("⚠️  Some unit test modules are missing:")
+            self.emit("⚠️  Some unit test modules are missing:")
             for missing in missing_tests:
-                print(f"   - {missing}")
-            print()
+                self.emit(f"   - {missing}")
+            self.emit()
         
         return existing_tests
     
     def run_individual_test(self, test_file: str) -> Dict[str, Any]:
         """Run an individual test file and return results."""
-        print(f"🧪 Running {test_file}...")
+        self.emit(f"🧪 Running {test_file}...")
         
         test_path = self.test_dir / test_file
         if not test_path.exists():
@@ -93,6 +103,9 @@ class UnitTestRunner:
         ]
         
         try:
+            # pytest prints straight to stdout, so the buffered progress
+            # lines (this suite's banner included) must go out first
+            self.flush_output()
             result = pytest.main(pytest_args)
             end_time = time.time()
             duration = end_time - start_time
@@ -132,21 +145,21 @@ class UnitTestRunner:
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all available unit tests."""
         if not BINDINGS_AVAILABLE:
-            print("❌ Cannot run unit tests - QtForge bindings not available")
+            self.emit("❌ Cannot run unit tests - QtForge bindings not available")
             return {'status': 'skipped', 'reason': 'Bindings not available'}
         
-        print("🚀 Running QtForge Python unit tests...")
-        print("=" * 60)
+        self.emit("🚀 Running QtForge Python unit tests...")
+        self.emit("=" * 60)
         
         existing_tests = self.check_test_files()
         available_tests = [test for test, exists in existing_tests.items() if exists]
         
         if not available_tests:
-            print("❌ No unit test files found!")
+            self.emit("❌ No unit test files found!")
             return {'status': 'no_tests'}
         
-        print(f"📋 Found {len(available_tests)} unit test modules")
-        print()
+        self.emit(f"📋 Found {len(available_tests)} unit test modules")
+        self.emit()
         
         overall_start_time = time.time()
         results = {}
@@ -161,13 +174,13 @@ class UnitTestRunner:
             duration = result.get('duration', 0)
             
             if status == 'passed':
-                print(f"   ✅ {test_file} - PASSED ({duration:.2f}s)")
+                self.emit(f"   ✅ {test_file} - PASSED ({duration:.2f}s)")
             elif status == 'failed':
-                print(f"   ❌ {test_file} - FAILED ({duration:.2f}s)")
+                self.emit(f"   ❌ {test_file} - FAILED ({duration:.2f}s)")
             elif status == 'skipped':
-                print(f"   ⏭️  {test_file} - SKIPPED ({result.get('reason', 'Unknown')})")
+                self.emit(f"   ⏭️  {test_file} - SKIPPED ({result.get('reason', 'Unknown')})")
             else:
-                print(f"   ⚠️  {test_file} - {status.upper()} ({duration:.2f}s)")
+                self.emit(f"   ⚠️  {test_file} - {status.upper()} ({duration:.2f}s)")
         
         overall_end_time = time.time()
         total_duration = overall_end_time - overall_start_time
@@ -178,21 +191,21 @@ class UnitTestRunner:
         skipped = sum(1 for r in results.values() if r['status'] == 'skipped')
         errors = sum(1 for r in results.values() if r['status'] == 'error')
         
-        print()
-        print("=" * 60)
-        print(f"📊 Unit Test Summary:")
-        print(f"   Total modules: {len(available_tests)}")
-        print(f"   Passed: {passed}")
-        print(f"   Failed: {failed}")
-        print(f"   Skipped: {skipped}")
-        print(f"   Errors: {errors}")
-        print(f"   Total time: {total_duration:.2f}s")
+        self.emit()
+        self.emit("=" * 60)
+        self.emit(f"📊 Unit Test Summary:")
+        self.emit(f"   Total modules: {len(available_tests)}")
+        self.emit(f"   Passed: {passed}")
+        self.emit(f"   Failed: {failed}")
+        self.emit(f"   Skipped: {skipped}")
+        self.emit(f"   Errors: {errors}")
+        self.emit(f"   Total time: {total_duration:.2f}s")
         
         if failed == 0 and errors == 0:
-            print("✅ All unit tests passed!")
+            self.emit("✅ All unit tests passed!")
             overall_status = 'passed'
         else:
-            print("❌ Some unit tests failed!")
+            self.emit("❌ Some unit tests failed!")
             overall_status = 'failed'
         
         return {
@@ -210,7 +223,7 @@ class UnitTestRunner:
     
     def run_coverage_analysis(self) -> Dict[str, Any]:
         """Run coverage analysis on unit tests."""
-        print("📈 Running coverage analysis...")
+        self.emit("📈 Running coverage analysis...")
         
         try:
             # Try to run with coverage
@@ -230,21 +243,21 @@ class UnitTestRunner:
                 report_result = subprocess.run(report_args, capture_output=True, text=True)
                 
                 if report_result.returncode == 0:
-                    print("Coverage Report:")
-                    print(report_result.stdout)
+                    self.emit("Coverage Report:")
+                    self.emit(report_result.stdout)
                     return {'status': 'success', 'report': report_result.stdout}
                 else:
-                    print(f"Coverage report failed: {report_result.stderr}")
+                    self.emit(f"Coverage report failed: {report_result.stderr}")
                     return {'status': 'report_failed', 'error': report_result.stderr}
             else:
-                print(f"Coverage run failed: {result.stderr}")
+                self.emit(f"Coverage run failed: {result.stderr}")
                 return {'status': 'run_failed', 'error': result.stderr}
                 
         except FileNotFoundError:
-            print("⚠️  Coverage tool not available. Install with: pip install coverage")
+            self.emit("⚠️  Coverage tool not available. Install with: pip install coverage")
             return {'status': 'tool_not_available'}
         except Exception as e:
-            print(f"Coverage analysis error: {e}")
+            self.emit(f"Coverage analysis error: {e}")
             return {'status': 'error', 'error': str(e)}
     
     def generate_test_report(self, results: Dict[str, Any]) -> str:
@@ -307,41 +320,56 @@ class UnitTestRunner:
 
 def main() -> None:
     """Main entry point for unit test runner."""
-    runner = UnitTestRunner()
-    
     # Parse command line arguments
-    if len(sys.argv) > 1:
-        arg = sys.argv[1]
-        
-        if arg in ["-h", "--help"]:
-            print("QtForge Python Unit Test Runner")
-            print()
-            print("Usage:")
-            print("  python test_unit_runner.py                # Run all unit tests")
-            print("  python test_unit_runner.py --coverage     # Run with coverage analysis")
-            print("  python test_unit_runner.py --report       # Generate detailed report")
-            print("  python test_unit_runner.py --help         # Show this help")
-            return 0
+    args = sys.argv[1:]
+    stream = "--stream" in args
+    args = [a for a in args if a != "--stream"]
+    arg = args[0] if args else None
+    
+    if arg in ["-h", "--help"]:
+        print("QtForge Python Unit Test Runner")
+        print()
+        print("Usage:")
+        print("  python test_unit_runner.py                # Run all unit tests")
+        print("  python test_unit_runner.py --coverage     # Run with coverage analysis")
+        print("  python test_unit_runner.py --report       # Generate detailed report")
+        print("  python test_unit_runner.py --stream       # Print progress as it happens")
+        print("  python test_unit_runner.py --help         # Show this help")
+        return 0
+    
+    # Bail out before building the runner when there is nothing to test
+    if not BINDINGS_AVAILABLE:
+        print("❌ Cannot run unit tests - QtForge bindings not available")
+        return 1
+    
+    runner = UnitTestRunner(stream=stream)
+    try:
+        return _run(runner, arg)
+    finally:
+        runner.flush_output()
+
+
+def _run(runner: UnitTestRunner, arg: str) -> int:
+    """Dispatch the requested runner mode."""
+    if arg == "--coverage":
+        # Run tests with coverage
+        results = runner.run_all_tests()
+        if results['status'] != 'skipped':
+            runner.run_coverage_analysis()
+        return 0 if results['status'] == 'passed' else 1
+    
+    elif arg == "--report":
+        # Run tests and generate detailed report
+        results = runner.run_all_tests()
+        report = runner.generate_test_report(results)
         
-        elif arg == "--coverage":
-            # Run tests with coverage
-            results = runner.run_all_tests()
-            if results['status'] != 'skipped':
-                runner.run_coverage_analysis()
-            return 0 if results['status'] == 'passed' else 1
+        # Save report to file
+        report_file = runner.test_dir / "unit_test_report.txt"
+        with open(report_file, 'w') as f:
+            f.write(report)
         
-        elif arg == "--report":
-            # Run tests and generate detailed report
-            results = runner.run_all_tests()
-            report = runner.generate_test_report(results)
-            
-            # Save report to file
-            report_file = runner.test_dir / "unit_test_report.txt"
-            with open(report_file, 'w') as f:
-                f.write(report)
-            
-            print(f"\n📄 Detailed report saved to: {report_file}")
-            return 0 if results['status'] == 'passed' else 1
+        runner.emit(f"\n📄 Detailed report saved to: {report_file}")
+        return 0 if results['status'] == 'passed' else 1
     
     # Default: run all tests
     results = runner.run_all_tests()
@@ -4,6 +4,7 @@ Unit tests for QtForge Python utils bindings.
 Tests individual functions and classes in the utils module with comprehensive coverage.
 """
 
+import contextlib
 import pytest
 import sys
 import os
@@ -12,16 +13,27 @@ import json
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
-# Add the build directory to Python path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../build'))
+qtforge = pytest.importorskip("qtforge", reason="QtForge bindings not available")
+utils = pytest.importorskip("qtforge.utils", reason="QtForge bindings not available")
 
-try:
-    import qtforge
-    import qtforge.utils as utils
-    BINDINGS_AVAILABLE = True
-except ImportError as e:
-    BINDINGS_AVAILABLE = False
-    pytest.skip(f"QtForge bindings not available: {e}", allow_module_level=True)
+
+@contextlib.contextmanager
+def log_level(level):
+    """Temporarily set the utils log level, restoring the original on exit."""
+    original_level = utils.get_log_level()
+    utils.set_log_level(level)
+    try:
+        yield
+    finally:
+        utils.set_log_level(original_level)
+
+
+# Public callables of the utils module, collected once for edge-case tests
+CALLABLES = [
+    (name, getattr(utils, name))
+    for name in dir(utils)
+    if not name.startswith('_') and callable(getattr(utils, name))
+]
 
 
 class TestVersionClass:
@@ -230,7 +242,7 @@ class TestJsonUtilities:
             try:
                 result = utils.parse_json('invalid json')
                 # Should either return None or raise exception
-            except:
+            except (TypeError, ValueError, RuntimeError):
                 pass  # Exception is acceptable
     
     def test_stringify_json_function(self) -> None:
@@ -285,20 +297,18 @@ class TestLoggingUtilities:
                 try:
                     func("Test message")
                     func("")  # Test empty message
-                except:
+                except (TypeError, ValueError, RuntimeError):
                     pass  # Some implementations might require additional parameters
     
-    def test_log_level_functions(self) -> None:
+    @pytest.mark.parametrize("level", [0, 1, 2, 3, 4])
+    def test_log_level_functions(self, level) -> None:
         """Test log level functions if available."""
         if hasattr(utils, 'set_log_level') and hasattr(utils, 'get_log_level'):
-            # Test setting and getting log level
+            # Test setting and getting log level, restoring it afterwards
             try:
-                original_level = utils.get_log_level()
-                utils.set_log_level(2)  # Assuming numeric levels
-                new_level = utils.get_log_level()
-                assert new_level == 2
-                utils.set_log_level(original_level)  # Restore
-            except:
+                with log_level(level):
+                    assert utils.get_log_level() == level
+            except (TypeError, ValueError):
                 pass  # Implementation might use different level system
 
 
@@ -333,7 +343,7 @@ class TestTimeUtilities:
                 formatted = utils.format_timestamp(timestamp, "yyyy-MM-dd")
                 assert isinstance(formatted, str)
                 assert len(formatted) > 0
-            except:
+            except (TypeError, ValueError, RuntimeError):
                 pass  # Implementation might use different format strings
     
     def test_sleep_function(self) -> None:
@@ -345,7 +355,7 @@ class TestTimeUtilities:
                 utils.sleep(0.1)  # Sleep for 100ms
                 elapsed = time.time() - start_time
                 assert elapsed >= 0.05  # Allow some tolerance
-            except:
+            except (TypeError, ValueError, RuntimeError):
                 pass  # Implementation might use different units
 
 
@@ -357,14 +367,10 @@ class TestUtilityModuleStructure:
         assert hasattr(utils, '__name__')
         assert utils.__name__ == 'qtforge.utils'
     
-    def test_module_functions_are_callable(self) -> None:
-        """Test that all module functions are callable."""
-        for attr_name in dir(utils):
-            if not attr_name.startswith('_'):
-                attr = getattr(utils, attr_name)
-                if callable(attr):
-                    # Just verify it's callable, don't call it
-                    assert callable(attr)
+    def test_module_functions_are_documented(self) -> None:
+        """Test that all public module functions carry a docstring."""
+        missing_docs = [name for name, func in CALLABLES if not func.__doc__]
+        assert not missing_docs, f"Functions without docstrings: {missing_docs}"
     
     def test_module_constants(self) -> None:
         """Test module constants if they exist."""
@@ -379,52 +385,20 @@ class TestUtilityModuleStructure:
 class TestErrorConditions:
     """Test error conditions and edge cases."""
     
-    def test_null_pointer_handling(self) -> None:
-        """Test handling of null/None inputs."""
-        functions_to_test = []
-        
-        # Collect all callable functions from utils module
-        for attr_name in dir(utils):
-            if not attr_name.startswith('_'):
-                attr = getattr(utils, attr_name)
-                if callable(attr):
-                    functions_to_test.append((attr_name, attr))
-        
-        # Test each function with None input
-        for func_name, func in functions_to_test:
-            try:
-                # Try calling with None - should not crash
-                result = func(None)
-                # If it returns something, it should be a valid response
-                assert result is not None or result is None
-            except (TypeError, ValueError, AttributeError):
-                # These exceptions are acceptable for None inputs
-                pass
-            except Exception as e:
-                # Other exceptions might indicate poor error handling
-                pytest.fail(f"Function {func_name} raised unexpected exception with None input: {e}")
-    
-    def test_empty_string_handling(self) -> None:
-        """Test handling of empty string inputs."""
-        string_functions = []
-        
-        # Collect functions that likely take string inputs
-        for attr_name in dir(utils):
-            if not attr_name.startswith('_'):
-                attr = getattr(utils, attr_name)
-                if callable(attr) and any(keyword in attr_name.lower() for keyword in 
-                                        ['string', 'trim', 'upper', 'lower', 'file', 'path', 'json']):
-                    string_functions.append((attr_name, attr))
-        
-        # Test each function with empty string
-        for func_name, func in string_functions:
-            try:
-                result = func("")
-                # Should return a valid result
-                assert result is not None or result == ""
-            except (TypeError, ValueError):
-                # These exceptions are acceptable for empty inputs
-                pass
+    @pytest.mark.parametrize("arg", [None, ""])
+    @pytest.mark.parametrize(("func_name", "func"), CALLABLES,
+                             ids=[name for name, _ in CALLABLES])
+    def test_degenerate_input_handling(self, func_name, func, arg) -> None:
+        """Test handling of None and empty string inputs."""
+        try:
+            # Degenerate input should not crash the binding
+            func(arg)
+        except (TypeError, ValueError, AttributeError):
+            # These exceptions are acceptable for None/empty inputs
+            pass
+        except Exception as e:
+            # Other exceptions might indicate poor error handling
+            pytest.fail(f"Function {func_name} raised unexpected exception with {arg!r} input: {e}")
     
     def test_large_input_handling(self) -> None:
         """Test handling of large inputs."""
@@ -15,29 +15,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import python_bridge
 from python_bridge import PythonPluginBridge
 
-
-class TestPythonBridgeScript(unittest.TestCase):
-    """Test cases for Python bridge script functionality"""
-
-    def setUp(self) -> None:
-        """Set up test environment"""
-        self.bridge = PythonPluginBridge()
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_plugin_path = None
-
-        # Create a test plugin
-        self.create_test_plugin()
-
-    def tearDown(self) -> None:
-        """Clean up test environment"""
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
-    def create_test_plugin(self) -> None:
-        """Create a test plugin for testing"""
-        plugin_content = '''
+# Test plugin handed to the bridge as source text, so no files are involved
+TEST_PLUGIN_SOURCE = '''
 class TestPlugin:
     def __init__(self) -> None:
         self.name = "Test Plugin"
@@ -92,9 +74,27 @@ def create_plugin() -> None:
     return TestPlugin()
 '''
 
-        self.test_plugin_path = os.path.join(self.temp_dir, "test_plugin.py")
-        with open(self.test_plugin_path, 'w') as f:
-            f.write(plugin_content)
+TEST_PLUGIN_LOAD_REQUEST = {
+    "type": "load_plugin",
+    "id": 1,
+    "plugin_source": TEST_PLUGIN_SOURCE,
+    "plugin_name": "test_plugin",
+    "plugin_class": "TestPlugin"
+}
+
+
+class TestPythonBridgeScript(unittest.TestCase):
+    """Test cases for Python bridge script functionality"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up a bridge with the test plugin loaded once for all tests"""
+        cls.bridge = PythonPluginBridge()
+
+        response = cls.bridge.handle_request(TEST_PLUGIN_LOAD_REQUEST)
+        if not response["success"]:
+            raise AssertionError(f"Failed to load test plugin: {response.get('error')}")
+        cls.plugin_id = response["plugin_id"]
 
     def test_bridge_initialization(self) -> None:
         """Test bridge initialization"""
@@ -110,14 +110,10 @@ def create_plugin() -> None:
 
     def test_plugin_loading(self) -> None:
         """Test plugin loading functionality"""
-        request = {
-            "type": "load_plugin",
-            "id": 1,
-            "plugin_path": self.test_plugin_path,
-            "plugin_class": "TestPlugin"
-        }
+        # Use a separate bridge so the shared test plugin stays untouched
+        bridge = PythonPluginBridge()
 
-        response = self.bridge.handle_request(request)
+        response = bridge.handle_request(TEST_PLUGIN_LOAD_REQUEST)
 
         self.assertTrue(response["success"])
         self.assertIn("plugin_id", response)
@@ -136,12 +132,32 @@ def create_plugin() -> None:
         self.assertIn("simple_method", method_names)
         self.assertIn("method_with_params", method_names)
 
-        return response["plugin_id"]
+    def test_plugin_loading_from_path(self) -> None:
+        """Test plugin loading from a file on disk"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            plugin_path = os.path.join(temp_dir, "test_plugin.py")
+            with open(plugin_path, 'w') as f:
+                f.write(TEST_PLUGIN_SOURCE)
+
+            request = {
+                "type": "load_plugin",
+                "id": 1,
+                "plugin_path": plugin_path,
+                "plugin_class": "TestPlugin"
+            }
+
+            response = PythonPluginBridge().handle_request(request)
+
+            self.assertTrue(response["success"])
+            self.assertEqual(response["plugin_id"], "test_plugin")
+            self.assertEqual(response["metadata"]["name"], "Test Plugin")
+        finally:
+            shutil.rmtree(temp_dir)
 
     def test_method_calling(self) -> None:
         """Test method calling functionality"""
-        # First load a plugin
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
 
         # Test simple method call
         request = {
@@ -157,9 +173,35 @@ def create_plugin() -> None:
         self.assertTrue(response["success"])
         self.assertEqual(response["result"], "simple_result")
 
+    def test_method_calling_module_function(self) -> None:
+        """Test calling a module-level function through the module wrapper"""
+        load_request = {
+            "type": "load_plugin",
+            "id": 1,
+            "plugin_source": "def greet(name):\n    return 'Hello, ' + name\n",
+            "plugin_name": "module_plugin"
+        }
+
+        bridge = PythonPluginBridge()
+        response = bridge.handle_request(load_request)
+        self.assertTrue(response["success"])
+
+        request = {
+            "type": "call_method",
+            "id": 2,
+            "plugin_id": "module_plugin",
+            "method_name": "greet",
+            "parameters": ["QtForge"]
+        }
+
+        response = bridge.handle_request(request)
+
+        self.assertTrue(response["success"])
+        self.assertEqual(response["result"], "Hello, QtForge")
+
     def test_method_with_parameters(self) -> None:
         """Test method calling with parameters"""
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
 
         request = {
             "type": "call_method",
@@ -179,7 +221,9 @@ def create_plugin() -> None:
     @unittest.skip("Property access not implemented in current bridge")
     def test_property_access(self) -> None:
         """Test property access functionality"""
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
+        # Restore the shared plugin state modified below
+        self.addCleanup(setattr, self.bridge.plugins[plugin_id], "counter", 0)
 
         # Test getting property
         get_request = {
@@ -214,7 +258,7 @@ def create_plugin() -> None:
     @unittest.skip("Event handling not implemented in current bridge")
     def test_event_handling(self) -> None:
         """Test event handling functionality"""
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
 
         # Test event subscription
         sub_request = {
@@ -252,7 +296,7 @@ def create_plugin() -> None:
 
     def test_plugin_info_retrieval(self) -> None:
         """Test plugin information retrieval"""
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
 
         request = {
             "type": "get_plugin_info",
@@ -269,7 +313,7 @@ def create_plugin() -> None:
 
     def test_error_handling(self) -> None:
         """Test error handling"""
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
 
         # Test calling non-existent method
         request = {
@@ -298,7 +342,6 @@ def create_plugin() -> None:
         self.assertIn("error", response)
         self.assertIn("traceback", response)
 
-    @unittest.skip("Code execution not implemented in current bridge")
     def test_code_execution(self) -> None:
         """Test code execution functionality"""
         request = {
@@ -313,9 +356,43 @@ def create_plugin() -> None:
         self.assertTrue(response["success"])
         self.assertEqual(response["result"], 4)
 
+    def test_code_execution_statements(self) -> None:
+        """Test code execution of statements using the request context"""
+        request = {
+            "type": "execute_code",
+            "id": 13,
+            "code": "result = value * 2",
+            "context": {"value": 21}
+        }
+
+        response = self.bridge.handle_request(request)
+
+        self.assertTrue(response["success"])
+        self.assertEqual(response["result"], 42)
+
+        # The same payload is served from the compiled code cache
+        hits = python_bridge._compile_code.cache_info().hits
+        response = self.bridge.handle_request(request)
+        self.assertEqual(response["result"], 42)
+        self.assertEqual(python_bridge._compile_code.cache_info().hits, hits + 1)
+
+    def test_code_execution_error(self) -> None:
+        """Test code execution reports errors"""
+        request = {
+            "type": "execute_code",
+            "id": 14,
+            "code": "1 / 0",
+            "context": {}
+        }
+
+        response = self.bridge.handle_request(request)
+
+        self.assertFalse(response["success"])
+        self.assertIn("error", response)
+
     def test_metadata_extraction(self) -> None:
         """Test metadata extraction functionality"""
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
         plugin = self.bridge.plugins[plugin_id]
 
         metadata = self.bridge.extract_plugin_metadata(plugin)
@@ -328,7 +405,7 @@ def create_plugin() -> None:
 
     def test_method_discovery(self) -> None:
         """Test method discovery functionality"""
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
         plugin = self.bridge.plugins[plugin_id]
 
         methods = self.bridge.discover_plugin_methods(plugin)
@@ -347,9 +424,23 @@ def create_plugin() -> None:
         self.assertIsInstance(method_with_params["parameters"], list)
         self.assertTrue(len(method_with_params["parameters"]) > 0)
 
+    def test_method_discovery_cache(self) -> None:
+        """Test method discovery is reused for instances of the same class"""
+        import python_bridge
+
+        plugin_id = self.plugin_id
+        plugin = self.bridge.plugins[plugin_id]
+
+        self.assertIn(type(plugin), python_bridge._method_cache)
+
+        first = self.bridge.discover_plugin_methods(plugin)
+        second = self.bridge.discover_plugin_methods(type(plugin)())
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
     def test_property_discovery(self) -> None:
         """Test property discovery functionality"""
-        plugin_id = self.test_plugin_loading()
+        plugin_id = self.plugin_id
         plugin = self.bridge.plugins[plugin_id]
 
         properties = self.bridge.discover_plugin_properties(plugin)
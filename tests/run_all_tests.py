@@ -6,26 +6,101 @@ This script runs all available tests for the QtForge Python bindings
 and provides a comprehensive report of the results.
 """
 
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import json
+import runpy
+import signal
 import sys
 import os
-import subprocess
+import random
+import traceback
 import time
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Resolved once so symlinks are not re-walked for every derived path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES_DIR = PROJECT_ROOT / "examples"
+
+# Example scripts exercised by run_example_tests()
+EXAMPLE_FILES = (
+    "basic_usage.py",
+    "plugin_management.py",
+)
+
+# Optional binding modules exercised by run_module_tests()
+OPTIONAL_MODULES = (
+    'communication', 'security', 'managers', 'orchestration',
+    'monitoring', 'threading', 'transactions', 'composition', 'marketplace'
+)
+
+# Bound by find_qtforge_bindings() once the bindings import successfully
+qtforge = None
+
+# Per-checkout state, kept in the build tree so clones and worktrees never
+# share it
+TEST_CACHE_DIR = PROJECT_ROOT / "build" / ".test_cache"
+
+# Directory the bindings were last found in, so later runs can skip the search
+BINDINGS_PATH_CACHE = TEST_CACHE_DIR / "bindings_path"
+
+# Latest result of every suite, consulted by --rerun-failed
+LAST_REPORT = TEST_CACHE_DIR / "last_report.json"
+
+def _read_cached_bindings_path() -> Optional[Path]:
+    """Return the cached bindings directory if it is still in this checkout."""
+    try:
+        cached = Path(BINDINGS_PATH_CACHE.read_text(encoding="utf-8").strip())
+    except OSError:
+        return None
+    # Never import another tree's bindings, even from a stale cache file
+    if not cached.is_dir() or PROJECT_ROOT not in cached.resolve().parents:
+        return None
+    return cached
+
+def _write_cached_bindings_path(path: Path) -> None:
+    """Remember ``path`` for the next run; failures are not fatal."""
+    try:
+        BINDINGS_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        BINDINGS_PATH_CACHE.write_text(str(path), encoding="utf-8")
+    except OSError:
+        pass
 
 def find_qtforge_bindings() -> bool:
     """Try to find and import QtForge bindings."""
+    global qtforge
     try:
         import qtforge
         return True
     except ImportError:
+        # Try the directory that worked last time before searching again
+        cached = _read_cached_bindings_path()
+        if cached is not None:
+            sys.path.insert(0, str(cached))
+            try:
+                import qtforge
+                print(f"Found QtForge bindings at: {cached}")
+                return True
+            except ImportError:
+                sys.path.remove(str(cached))
+
         # Try to find the bindings in the build directory
-        current_dir = Path(__file__).parent
         possible_paths = [
-            current_dir.parent / "build" / "src" / "python",
-            current_dir.parent / "build" / "Release" / "src" / "python",
-            current_dir.parent / "build" / "Debug" / "src" / "python",
-            current_dir.parent / "src" / "python",
+            PROJECT_ROOT / "build" / "src" / "python",
+            PROJECT_ROOT / "build" / "Release" / "src" / "python",
+            PROJECT_ROOT / "build" / "Debug" / "src" / "python",
+            PROJECT_ROOT / "src" / "python",
         ]
         
         for path in possible_paths:
@@ -34,31 +109,48 @@ def find_qtforge_bindings() -> bool:
                 try:
                     import qtforge
                     print(f"Found QtForge bindings at: {path}")
+                    _write_cached_bindings_path(path)
                     return True
                 except ImportError:
                     continue
         
         return False
 
+# The binding metadata below is fixed for the lifetime of the process, so
+# each value is fetched across the C++ boundary once and then reused.
+
+@functools.lru_cache(maxsize=None)
+def available_modules() -> List[str]:
+    """Return qtforge.list_available_modules(), fetched once."""
+    return qtforge.list_available_modules()
+
+@functools.lru_cache(maxsize=None)
+def qtforge_version() -> str:
+    """Return qtforge.get_version(), fetched once."""
+    return qtforge.get_version()
+
+@functools.lru_cache(maxsize=None)
+def build_info() -> Dict[str, Any]:
+    """Return qtforge.get_build_info(), fetched once."""
+    return qtforge.get_build_info()
+
 def run_basic_tests() -> Tuple[bool, str]:
     """Run basic functionality tests."""
     print("Running basic functionality tests...")
     
     try:
-        import qtforge
-        
         # Test basic connection
         result = qtforge.test_connection()
         if "QtForge" not in result:
             return False, "Connection test failed"
         
         # Test version info
-        version = qtforge.get_version()
+        version = qtforge_version()
         if not version or not isinstance(version, str):
             return False, "Version test failed"
         
         # Test module listing
-        modules = qtforge.list_available_modules()
+        modules = available_modules()
         if not isinstance(modules, list) or "core" not in modules:
             return False, "Module listing test failed"
         
@@ -87,50 +179,208 @@ def run_unittest_suite() -> Tuple[bool, str]:
     except Exception as e:
         return False, f"Unittest suite failed: {e}"
 
-def run_example_tests() -> Tuple[bool, str]:
-    """Run example scripts to verify they work."""
+# Only the tail of an example's stderr is reported, so keep a bounded
+# window of it instead of buffering the whole stream.
+STDERR_CHUNK_SIZE = 4096
+STDERR_TAIL_CHUNKS = 16
+
+async def run_script(script_path: Path, timeout: float) -> Tuple[int, str]:
+    """Run a Python script and return its exit code and the tail of stderr.
+
+    stdout is discarded and stderr is drained into a bounded buffer, so
+    memory stays constant however much the script prints. Raises
+    asyncio.TimeoutError if the script outlives ``timeout``.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, str(script_path),
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+        # Descriptors are created non-inheritable, so the close-all-fds
+        # loop is redundant; skipping it also lets CPython use posix_spawn.
+        close_fds=False,
+    )
+    tail = deque(maxlen=STDERR_TAIL_CHUNKS)
+
+    async def drain_stderr() -> None:
+        while chunk := await proc.stderr.read(STDERR_CHUNK_SIZE):
+            tail.append(chunk)
+
+    try:
+        await asyncio.wait_for(asyncio.gather(drain_stderr(), proc.wait()), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, b"".join(tail).decode(errors="replace").rstrip()
+
+def list_files(directory: Path) -> set:
+    """Return the names of the regular files in ``directory``.
+
+    One scandir pass replaces a stat call per candidate; a missing
+    directory simply yields no files.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+class _TailWriter(io.TextIOBase):
+    """Text stream that keeps only the last ``limit`` characters written."""
+
+    def __init__(self, limit: int = STDERR_CHUNK_SIZE * STDERR_TAIL_CHUNKS) -> None:
+        super().__init__()
+        self._limit = limit
+        self._tail = deque()
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        kept = s[-self._limit:]
+        self._tail.append(kept)
+        self._size += len(kept)
+        while self._size - len(self._tail[0]) >= self._limit:
+            self._size -= len(self._tail.popleft())
+        return len(s)
+
+    def getvalue(self) -> str:
+        return "".join(self._tail)[-self._limit:]
+
+class _ScriptTimeout(BaseException):
+    """Raised by SIGALRM when an in-process script outlives its timeout.
+
+    Derives from BaseException so neither the script nor the runner
+    mistakes it for an ordinary error, and a TimeoutError raised by the
+    script itself is never reported as a harness timeout.
+    """
+
+def _raise_timeout(signum, frame) -> None:
+    raise _ScriptTimeout
+
+def run_script_in_process(script_path: Path, timeout: float) -> Tuple[int, str]:
+    """Run a Python script in this interpreter via runpy.
+
+    Avoids interpreter startup and re-importing qtforge for every script,
+    at the cost of isolation: scripts run one at a time and share loaded
+    modules. sys.path and sys.argv are restored afterwards. The timeout is
+    enforced with SIGALRM where available and raises _ScriptTimeout.
+    """
+    stderr = _TailWriter()
+    saved_path, saved_argv = sys.path[:], sys.argv[:]
+    sys.argv = [str(script_path)]
+    alarm = hasattr(signal, "setitimer")
+    if alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        with open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull), \
+                contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(str(script_path), run_name="__main__")
+                returncode = 0
+            except SystemExit as e:
+                if e.code is None or isinstance(e.code, int):
+                    returncode = e.code or 0
+                else:
+                    print(e.code, file=sys.stderr)
+                    returncode = 1
+            except Exception:
+                traceback.print_exc()
+                returncode = 1
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        sys.path[:] = saved_path
+        sys.argv = saved_argv
+    return returncode, stderr.getvalue().rstrip()
+
+def _example_report(example_file: str, returncode: int, stderr: str) -> List[str]:
+    """Format the report lines for a finished example script."""
+    if returncode == 0:
+        return [f"✅ {example_file}: Success"]
+    lines = [f"❌ {example_file}: Failed with code {returncode}"]
+    if stderr:
+        lines.append(f"   Error: ...{stderr[-200:]}")
+    return lines
+
+def _run_example_in_process(example_path: Path, present: set) -> List[str]:
+    """Run a single example script in-process and return its report lines."""
+    example_file = example_path.name
+    if example_file not in present:
+        return [f"❌ {example_file}: File not found"]
+
+    try:
+        return _example_report(
+            example_file, *run_script_in_process(example_path, timeout=30)
+        )
+    except _ScriptTimeout:
+        return [f"❌ {example_file}: Timeout"]
+    except Exception as e:
+        return [f"❌ {example_file}: Exception - {e}"]
+
+async def _run_example(example_path: Path, present: set) -> List[str]:
+    """Run a single example script and return its report lines."""
+    example_file = example_path.name
+    if example_file not in present:
+        return [f"❌ {example_file}: File not found"]
+
+    try:
+        # Run the example script
+        return _example_report(
+            example_file, *await run_script(example_path, timeout=30)
+        )
+
+    except asyncio.TimeoutError:
+        return [f"❌ {example_file}: Timeout"]
+    except Exception as e:
+        return [f"❌ {example_file}: Exception - {e}"]
+
+async def _run_examples(paths: List[Path], present: set, jobs: int) -> List[List[str]]:
+    """Run example scripts concurrently, at most ``jobs`` at a time."""
+    limit = asyncio.Semaphore(jobs)
+
+    async def run_one(path: Path) -> List[str]:
+        async with limit:
+            return await _run_example(path, present)
+
+    return await asyncio.gather(*(run_one(path) for path in paths))
+
+def run_example_tests(jobs: int = None, in_process: bool = False) -> Tuple[bool, str]:
+    """Run example scripts to verify they work.
+
+    By default each example runs in its own interpreter, so the scripts are
+    started concurrently and their reports are collected in submission
+    order. With ``in_process`` they run sequentially in this interpreter.
+    """
     print("Running example scripts...")
     
-    examples_dir = Path(__file__).parent.parent / "examples"
-    example_files = [
-        "basic_usage.py",
-        "plugin_management.py"
-    ]
+    examples_dir = EXAMPLES_DIR
+    example_files = EXAMPLE_FILES
     
+    present = list_files(examples_dir)
     results = []
+    success_count = 0
     
-    for example_file in example_files:
-        example_path = examples_dir / example_file
-        if not example_path.exists():
-            results.append(f"❌ {example_file}: File not found")
-            continue
-        
-        try:
-            # Run the example script
-            result = subprocess.run(
-                [sys.executable, str(example_path)],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                results.append(f"✅ {example_file}: Success")
-            else:
-                results.append(f"❌ {example_file}: Failed with code {result.returncode}")
-                if result.stderr:
-                    results.append(f"   Error: {result.stderr[:200]}...")
-                    
-        except subprocess.TimeoutExpired:
-            results.append(f"❌ {example_file}: Timeout")
-        except Exception as e:
-            results.append(f"❌ {example_file}: Exception - {e}")
+    paths = [examples_dir / name for name in example_files]
+    if in_process:
+        reports = [_run_example_in_process(path, present) for path in paths]
+    else:
+        jobs = jobs or os.cpu_count() or 1
+        reports = asyncio.run(_run_examples(paths, present, jobs))
+    
+    for lines in reports:
+        # The first line of each example's report carries its status
+        success_count += lines[0].startswith("✅")
+        results.extend(lines)
     
-    success_count = sum(1 for r in results if r.startswith("✅"))
     total_count = len(example_files)
     
     success = success_count == total_count
-    message = f"{success_count}/{total_count} examples passed\n" + "\n".join(results)
+    message = "\n".join([f"{success_count}/{total_count} examples passed", *results])
     
     return success, message
 
@@ -139,51 +389,47 @@ def run_module_tests() -> Tuple[bool, str]:
     print("Running module-specific tests...")
     
     try:
-        import qtforge
-        
         results = []
-        available_modules = qtforge.list_available_modules()
+        success_count = 0
+        modules = available_modules()
         
         # Test core module
-        if "core" in available_modules:
+        if "core" in modules:
             try:
                 from qtforge.core import PluginManager, PluginState, Version
                 manager = PluginManager()
                 version = Version(1, 0, 0)
                 results.append("✅ Core module: Success")
+                success_count += 1
             except Exception as e:
                 results.append(f"❌ Core module: {e}")
         
         # Test utils module
-        if "utils" in available_modules:
+        if "utils" in modules:
             try:
                 from qtforge import utils
                 test_result = utils.test_utils()
                 results.append("✅ Utils module: Success")
+                success_count += 1
             except Exception as e:
                 results.append(f"❌ Utils module: {e}")
         
         # Test optional modules
-        optional_modules = [
-            'communication', 'security', 'managers', 'orchestration',
-            'monitoring', 'threading', 'transactions', 'composition', 'marketplace'
-        ]
-        
-        for module_name in optional_modules:
-            if module_name in available_modules:
+        for module_name in OPTIONAL_MODULES:
+            if module_name in modules:
                 try:
                     module = getattr(qtforge, module_name)
                     test_func = getattr(module, f'test_{module_name}')
                     test_result = test_func()
                     results.append(f"✅ {module_name.title()} module: Success")
+                    success_count += 1
                 except Exception as e:
                     results.append(f"❌ {module_name.title()} module: {e}")
         
-        success_count = sum(1 for r in results if r.startswith("✅"))
         total_count = len(results)
         
         success = success_count == total_count
-        message = f"{success_count}/{total_count} modules passed\n" + "\n".join(results)
+        message = "\n".join([f"{success_count}/{total_count} modules passed", *results])
         
         return success, message
         
@@ -201,13 +447,11 @@ def print_system_info() -> None:
     print(f"Platform: {sys.platform}")
     
     try:
-        import qtforge
-        print(f"QtForge Version: {qtforge.get_version()}")
-        print(f"Available Modules: {', '.join(qtforge.list_available_modules())}")
+        print(f"QtForge Version: {qtforge_version()}")
+        print(f"Available Modules: {', '.join(available_modules())}")
         
-        build_info = qtforge.get_build_info()
         print("Build Information:")
-        for key, value in build_info.items():
+        for key, value in build_info().items():
             if isinstance(value, dict):
                 print(f"  {key}:")
                 for sub_key, sub_value in value.items():
@@ -218,12 +462,111 @@ def print_system_info() -> None:
     except Exception as e:
         print(f"Could not get QtForge information: {e}")
 
-def main() -> None:
+def save_report(results: List[Tuple[str, bool, str]], duration: float, filename: str) -> None:
+    """Write the suite results to ``filename`` as a JSON report.
+
+    The report is serialized in memory and written with a single call,
+    using orjson when it is installed.
+    """
+    report = {
+        "duration": duration,
+        "passed": sum(success for _, success, _ in results),
+        "total": len(results),
+        "results": [
+            {"name": name, "passed": success, "message": message}
+            for name, success, message in results
+        ],
+    }
+    if ORJSON_AVAILABLE:
+        blob = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    else:
+        blob = json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(filename, "wb") as f:
+        f.write(blob)
+
+def load_report_results(filename: Path) -> Optional[List[Tuple[str, bool, str]]]:
+    """Return the suite results saved in a report.
+
+    Returns None if the report is missing or unreadable.
+    """
+    try:
+        with open(filename, "rb") as f:
+            report = json.load(f)
+        return [(r["name"], r["passed"], r["message"]) for r in report["results"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def load_failed_suites(filename: Path) -> Optional[set]:
+    """Return the names of the suites that failed in a saved report.
+
+    Returns None if the report is missing or unreadable.
+    """
+    results = load_report_results(filename)
+    if results is None:
+        return None
+    return {name for name, success, _ in results if not success}
+
+def merge_results(filename: Path,
+                  results: List[Tuple[str, bool, str]]) -> List[Tuple[str, bool, str]]:
+    """Overlay ``results`` on the suite results saved in ``filename``.
+
+    Suites that did not run this time (--rerun-failed, --fail-fast) keep
+    their previous result, so later reruns still see their failures.
+    """
+    merged = {result[0]: result for result in load_report_results(filename) or ()}
+    merged.update((result[0], result) for result in results)
+    return list(merged.values())
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that need a count of at least one."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Run all QtForge Python binding tests"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=_positive_int, default=None,
+        help="Number of example scripts to run in parallel (default: CPU count)"
+    )
+    parser.add_argument(
+        "--in-process", action="store_true",
+        help="Run example scripts sequentially in this interpreter instead of "
+             "spawning one per script"
+    )
+    parser.add_argument(
+        "-x", "--fail-fast", action="store_true",
+        help="Stop after the first test suite that fails"
+    )
+    parser.add_argument(
+        "--shuffle", action="store_true",
+        help="Run the test suites in random order to expose ordering dependencies"
+    )
+    parser.add_argument(
+        "--rerun-failed", action="store_true",
+        help="Only run the test suites that failed in the previous run"
+    )
+    parser.add_argument(
+        "--report", metavar="FILE",
+        help="Write the suite results to FILE as JSON"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None) -> None:
     """Main test runner function."""
+    args = parse_args(argv)
+
     print("QtForge Python Bindings - Comprehensive Test Runner")
     print("=" * 60)
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     # Check if QtForge bindings are available
     if not find_qtforge_bindings():
@@ -243,11 +586,27 @@ def main() -> None:
     test_suites = [
         ("Basic Functionality", run_basic_tests),
         ("Unittest Suite", run_unittest_suite),
-        ("Example Scripts", run_example_tests),
+        ("Example Scripts", lambda: run_example_tests(args.jobs, args.in_process)),
         ("Module Tests", run_module_tests),
     ]
+    if args.rerun_failed:
+        failed = load_failed_suites(LAST_REPORT)
+        rerun = [suite for suite in test_suites if suite[0] in (failed or ())]
+        if rerun:
+            test_suites = rerun
+            print(f"\n🔁 Re-running {len(test_suites)} test suite(s) that failed last time")
+        elif failed:
+            # A stale report: none of its failed suites exist any more
+            print("\nNo previously failed suite matches a current one; running all test suites")
+        elif failed is None:
+            print("\nNo previous report found; running all test suites")
+        else:
+            print("\nNo failures in the previous run; running all test suites")
+    if args.shuffle:
+        random.shuffle(test_suites)
     
     results = []
+    passed_count = 0
     
     print("\n" + "=" * 60)
     print("RUNNING TEST SUITES")
@@ -258,6 +617,7 @@ def main() -> None:
         try:
             success, message = test_func()
             results.append((suite_name, success, message))
+            passed_count += success
             
             if success:
                 print(f"✅ {suite_name}: PASSED")
@@ -269,16 +629,20 @@ def main() -> None:
         except Exception as e:
             results.append((suite_name, False, str(e)))
             print(f"❌ {suite_name}: EXCEPTION - {e}")
+        
+        if args.fail_fast and passed_count < len(results):
+            skipped = len(test_suites) - len(results)
+            if skipped:
+                print(f"\n⏭️  --fail-fast: skipping {skipped} remaining test suite(s)")
+            break
     
     # Print final results
-    end_time = time.time()
-    duration = end_time - start_time
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
     
     print("\n" + "=" * 60)
     print("FINAL RESULTS")
     print("=" * 60)
     
-    passed_count = sum(1 for _, success, _ in results if success)
     total_count = len(results)
     
     for suite_name, success, message in results:
@@ -288,6 +652,15 @@ def main() -> None:
     print(f"\nOverall: {passed_count}/{total_count} test suites passed")
     print(f"Duration: {duration:.2f} seconds")
     
+    if args.report:
+        save_report(results, duration, args.report)
+        print(f"Report written to: {args.report}")
+    try:
+        LAST_REPORT.parent.mkdir(parents=True, exist_ok=True)
+        save_report(merge_results(LAST_REPORT, results), duration, LAST_REPORT)
+    except OSError:
+        pass
+    
     if passed_count == total_count:
         print("\n🎉 ALL TESTS PASSED! QtForge Python bindings are working correctly.")
         return 0
@@ -7,10 +7,44 @@ Generates consistent test configurations, metadata, and mock data.
 import json
 import uuid
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _configuration_schema() -> Dict[str, Any]:
+    """Return the configuration schema every generated plugin uses.
+
+    Built fresh for each plugin, so a test that edits one plugin's schema
+    never affects another's.
+    """
+    return {
+        "type": "object",
+        "properties": {
+            "enabled": {"type": "boolean", "default": True},
+            "log_level": {"type": "string", "default": "info"},
+            "timeout": {"type": "integer", "default": 30000}
+        }
+    }
+
+
+def _batch_uuids(count: int) -> List[str]:
+    """Generate ``count`` random UUID4 strings from a single urandom call."""
+    # A negative count yields no ids, as the old per-id loop did
+    count = max(count, 0)
+    raw = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+        for i in range(0, 16 * count, 16)
+    ]
+
 
 class TestDataGenerator:
     """Generates test data for QtForge testing."""
@@ -18,6 +52,8 @@ class TestDataGenerator:
     def __init__(self, output_dir: str = "test_data"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # One timestamp per generator run, shared by everything it produces
+        self._run_timestamp = datetime.now().isoformat()
     
     def generate_plugin_metadata(self, 
                                 name: str = "TestPlugin",
@@ -27,14 +63,14 @@ class TestDataGenerator:
         """Generate plugin metadata JSON."""
         
         metadata = {
-            "id": str(uuid.uuid4()),
+            "id": kwargs.get("id") or str(uuid.uuid4()),
             "name": name,
             "version": version,
             "type": plugin_type,
             "description": kwargs.get("description", f"Test plugin {name}"),
             "author": kwargs.get("author", "QtForge Test Suite"),
             "license": kwargs.get("license", "MIT"),
-            "created": datetime.now().isoformat(),
+            "created": kwargs.get("created", self._run_timestamp),
             "api_version": kwargs.get("api_version", "3.2.0"),
             
             "dependencies": kwargs.get("dependencies", {}),
@@ -48,14 +84,7 @@ class TestDataGenerator:
             
             "interfaces": kwargs.get("interfaces", ["IPlugin"]),
             
-            "configuration_schema": {
-                "type": "object",
-                "properties": {
-                    "enabled": {"type": "boolean", "default": True},
-                    "log_level": {"type": "string", "default": "info"},
-                    "timeout": {"type": "integer", "default": 30000}
-                }
-            },
+            "configuration_schema": _configuration_schema(),
             
             "commands": kwargs.get("commands", ["status", "configure", "test"]),
             
@@ -70,13 +99,14 @@ class TestDataGenerator:
     
     def generate_configuration(self, 
                              scope: str = "global",
-                             plugin_id: Optional[str] = None) -> Dict[str, Any]:
+                             plugin_id: Optional[str] = None,
+                             timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Generate test configuration data."""
         
         config = {
             "scope": scope,
             "plugin_id": plugin_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or self._run_timestamp,
             
             "logging": {
                 "level": "debug",
@@ -123,6 +153,7 @@ class TestDataGenerator:
         
         plugins = []
         plugin_types = ["native", "python", "lua", "remote"]
+        ids = _batch_uuids(count)
         
         for i in range(count):
             plugin_type = plugin_types[i % len(plugin_types)]
@@ -137,6 +168,7 @@ class TestDataGenerator:
                 kwargs["interfaces"] = ["IPlugin", "IAdvancedPlugin"]
             
             plugin = self.generate_plugin_metadata(
+                id=ids[i],
                 name=name,
                 version=f"1.{i}.0",
                 plugin_type=plugin_type,
@@ -226,46 +258,55 @@ class TestDataGenerator:
         """Save test data to JSON file."""
         
         filepath = self.output_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            filepath.write_bytes(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            # Serialize up front so the file gets one large write instead of
+            # json.dump's many small ones. Like orjson, write UTF-8 with
+            # non-ASCII characters unescaped, so both branches give the same
+            # bytes.
+            with open(filepath, 'wb', buffering=65536) as f:
+                f.write(json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
         
         return filepath
     
     def generate_all_test_data(self) -> Dict[str, Path]:
-        """Generate all test data files."""
-        
-        generated_files = {}
-        
-        # Plugin metadata
-        plugins = self.generate_test_plugins(10)
-        generated_files["plugins"] = self.save_test_data(
-            {"plugins": plugins}, "test_plugins.json"
-        )
-        
-        # Configurations
-        global_config = self.generate_configuration("global")
-        generated_files["global_config"] = self.save_test_data(
-            global_config, "global_config.json"
-        )
-        
-        plugin_config = self.generate_configuration("plugin", "test_plugin_1")
-        generated_files["plugin_config"] = self.save_test_data(
-            plugin_config, "plugin_config.json"
-        )
-        
-        # Performance test data
-        perf_data = self.generate_performance_test_data()
-        generated_files["performance"] = self.save_test_data(
-            perf_data, "performance_test_data.json"
-        )
+        """Generate all test data files.
+
+        Payloads are built first; the files are then written concurrently
+        since each goes to a distinct path.
+        """
         
-        # Security test data
-        security_data = self.generate_security_test_data()
-        generated_files["security"] = self.save_test_data(
-            security_data, "security_test_data.json"
-        )
+        outputs = {
+            # Plugin metadata
+            "plugins": (
+                {"plugins": self.generate_test_plugins(10)}, "test_plugins.json"
+            ),
+            # Configurations
+            "global_config": (
+                self.generate_configuration("global"), "global_config.json"
+            ),
+            "plugin_config": (
+                self.generate_configuration("plugin", "test_plugin_1"),
+                "plugin_config.json"
+            ),
+            # Performance test data
+            "performance": (
+                self.generate_performance_test_data(), "performance_test_data.json"
+            ),
+            # Security test data
+            "security": (
+                self.generate_security_test_data(), "security_test_data.json"
+            ),
+        }
         
-        return generated_files
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            paths = executor.map(
+                lambda item: self.save_test_data(*item), outputs.values()
+            )
+            return dict(zip(outputs, paths))
 
 
 def main():
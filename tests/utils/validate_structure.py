@@ -5,75 +5,89 @@ Checks that all test files are properly organized and CMakeLists.txt files exist
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 
+# Go up one level since we're now in utils/
+_TEST_DIR = Path(__file__).resolve().parent.parent
+
+_ADD_SUBDIRECTORY_RE = re.compile(r'add_subdirectory\(\s*([A-Za-z_]\w*)\s*\)')
+
+# Expected module directories
+EXPECTED_MODULES = (
+    'core', 'communication', 'security', 'managers',
+    'monitoring', 'orchestration', 'utils', 'platform',
+    'integration', 'build_system', 'bridges', 'composition',
+    'marketplace', 'transactions', 'python'
+)
+
 
 def validate_test_structure() -> None:
     """Validate the new modular test structure."""
-    test_dir = Path(__file__).parent.parent  # Go up one level since we're now in utils/
+    test_dir = _TEST_DIR
     errors = []
     warnings = []
-
-    # Expected module directories
-    expected_modules = [
-        'core', 'communication', 'security', 'managers',
-        'monitoring', 'orchestration', 'utils', 'platform',
-        'integration', 'build_system', 'bridges', 'composition',
-        'marketplace', 'transactions', 'python'
-    ]
+    expected_modules = EXPECTED_MODULES
 
     print("🔍 Validating QtForge test structure...")
     print(f"📁 Test directory: {test_dir}")
 
+    # List the test directory once; DirEntry caches the file type
+    with os.scandir(test_dir) as it:
+        entries = {entry.name: entry for entry in it}
+
     # Check if all expected module directories exist
+    ok_lines = []
     for module in expected_modules:
-        module_path = test_dir / module
-        if not module_path.exists():
+        entry = entries.get(module)
+        if entry is None:
             errors.append(f"Missing module directory: {module}")
-        elif not module_path.is_dir():
+        elif not entry.is_dir():
             errors.append(f"Expected directory but found file: {module}")
         else:
             # Check if CMakeLists.txt exists in module
-            cmake_file = module_path / "CMakeLists.txt"
-            if not cmake_file.exists():
+            if not os.path.exists(os.path.join(entry.path, "CMakeLists.txt")):
                 errors.append(f"Missing CMakeLists.txt in module: {module}")
-            print(f"✅ Module {module}: OK")
+            ok_lines.append(f"✅ Module {module}: OK")
+    if ok_lines:
+        print("\n".join(ok_lines))
 
     # Check for orphaned test files in root
-    test_files_in_root = list(test_dir.glob("test_*.cpp"))
+    test_files_in_root = [
+        name for name in entries
+        if name.startswith("test_") and name.endswith(".cpp")
+    ]
     if test_files_in_root:
         warnings.append(
             f"Found {len(test_files_in_root)} test files in root directory")
-        for file in test_files_in_root:
-            warnings.append(f"  - {file.name}")
+        for name in test_files_in_root:
+            warnings.append(f"  - {name}")
 
     # Check main CMakeLists.txt
     main_cmake = test_dir / "CMakeLists.txt"
-    if not main_cmake.exists():
+    if "CMakeLists.txt" not in entries:
         errors.append("Missing main CMakeLists.txt")
     else:
         # Check if it includes all modules
-        content = main_cmake.read_text()
+        included = set(_ADD_SUBDIRECTORY_RE.findall(main_cmake.read_text()))
         for module in expected_modules:
-            if f"add_subdirectory({module})" not in content:
+            if module not in included:
                 warnings.append(
                     f"Module {module} not included in main CMakeLists.txt")
 
     # Summary
     print("\n📊 Validation Summary:")
-    print(
-        f"✅ Modules found: {len([m for m in expected_modules if (test_dir / m).exists()])}/{len(expected_modules)}")
+    found = sum(module in entries for module in expected_modules)
+    print(f"✅ Modules found: {found}/{len(expected_modules)}")
 
     if warnings:
-        print(f"⚠️  Warnings: {len(warnings)}")
-        for warning in warnings:
-            print(f"   {warning}")
+        print("\n".join([f"⚠️  Warnings: {len(warnings)}",
+                         *(f"   {warning}" for warning in warnings)]))
 
     if errors:
-        print(f"❌ Errors: {len(errors)}")
-        for error in errors:
-            print(f"   {error}")
+        print("\n".join([f"❌ Errors: {len(errors)}",
+                         *(f"   {error}" for error in errors)]))
         return False
     else:
         print("🎉 All validations passed!")
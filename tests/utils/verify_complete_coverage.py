@@ -4,98 +4,239 @@ Verification script for complete QtForge test coverage.
 Validates that all modules have corresponding test files and proper CMake configuration.
 """
 
+import argparse
+import json
 import os
+import re
 import sys
-from pathlib import Path
-
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+
+def _list_dir(path) -> dict:
+    """Return ``{name: DirEntry}`` for ``path``, or an empty dict if missing.
+
+    DirEntry caches the file type from the directory listing, so callers
+    can filter on is_dir()/is_file() without further stat calls.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _find_test_cpps(files: dict) -> list:
+    """Return the names of the ``test_*.cpp`` files in a directory listing."""
+    return [
+        name for name, entry in files.items()
+        if name.startswith("test_") and name.endswith(".cpp") and entry.is_file()
+    ]
+
+
+# First argument of each add_subdirectory() call in a CMakeLists.txt
+_ADD_SUBDIRECTORY_RE = re.compile(r"add_subdirectory\(\s*([^)\s]+)")
+
+# Test modules that don't have direct src counterparts
+_EXTRA_TEST_MODULES = frozenset({"platform", "integration", "build_system"})
+
+# Successful runs record the mtimes of everything the verdict depends on;
+# while none of them change the verification is skipped.
+CACHE_FILENAME = ".verify_cache.json"
+CACHE_VERSION = 1
+
+
+def _cache_is_fresh(cache_file: str) -> bool:
+    """Return True if every path recorded in the cache still has its mtime."""
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+        if cache.get("version") != CACHE_VERSION:
+            return False
+        return all(
+            os.stat(path).st_mtime_ns == mtime
+            for path, mtime in cache["mtimes"].items()
+        )
+    except (OSError, ValueError, KeyError, AttributeError):
+        return False
 
-def verify_complete_coverage() -> None:
-    """Verify complete test coverage for all QtForge modules."""
-    test_dir = Path(__file__).parent.parent  # Go up one level since we're now in utils/
-    src_dir = test_dir.parent / "src"
 
-    print("🔍 Verifying complete QtForge test coverage...")
-    print(f"📁 Test directory: {test_dir}")
-    print(f"📁 Source directory: {src_dir}")
+def _write_cache(cache_file: str, watched: list) -> None:
+    """Record a successful run; failing to write the cache is harmless."""
+    try:
+        # Open (and so create) the cache before taking the mtimes, since
+        # adding it changes the mtime of the directory that holds it
+        with open(cache_file, "w") as f:
+            mtimes = {path: os.stat(path).st_mtime_ns for path in watched}
+            json.dump({"version": CACHE_VERSION, "mtimes": mtimes}, f)
+    except OSError:
+        pass
+
+
+class ModuleScan(NamedTuple):
+    """Directory listing of one test module and what was found in it."""
+    name: str
+    files: dict
+    has_cmake: bool
+    test_files: list
+
+
+def _scan_module(name: str, path: str) -> ModuleScan:
+    """List a test module directory once and pick out its CMake and test files."""
+    files = _list_dir(path)
+    return ModuleScan(
+        name=name,
+        files=files,
+        has_cmake="CMakeLists.txt" in files,
+        test_files=sorted(_find_test_cpps(files)),
+    )
+
+
+def _discover_test_modules(test_dir: str) -> tuple:
+    """List ``test_dir`` and scan every test module directory in it.
+
+    Each module scan is submitted to a thread pool as soon as its entry is
+    seen, so the module listings overlap with the walk of ``test_dir``.
+    Returns ``({name: DirEntry}, {module: ModuleScan})``.
+    """
+    entries = {}
+    futures = {}
+    try:
+        with ThreadPoolExecutor(max_workers=16) as executor, \
+                os.scandir(test_dir) as it:
+            for entry in it:
+                entries[entry.name] = entry
+                name = entry.name
+                if entry.is_dir() and not name.startswith('.') and name != '__pycache__':
+                    futures[name] = executor.submit(_scan_module, name, entry.path)
+    except OSError:
+        pass
+    return entries, {name: future.result() for name, future in futures.items()}
+
+
+class Finding(NamedTuple):
+    """One line of the verification report.
+
+    ``level`` is one of ``info``, ``ok``, ``warning`` or ``error``; any
+    ``error`` finding makes the verification fail. ``scope`` names the check
+    or test module the finding belongs to.
+    """
+    level: str
+    message: str
+    scope: str = ""
+
+
+def _iter_findings(test_dir: str, src_dir: str, quick: bool = False,
+                   watched: list = None):
+    """Run the coverage checks, yielding a Finding for each report line.
+
+    With ``quick``, stop after the first check phase that reports an error.
+    When the run gets through every check, the paths its verdict depends on
+    are appended to ``watched``.
+    """
+    def stop_early():
+        return Finding("info", "\n⏩ Quick mode: stopping at the first failed check")
+
+    yield Finding("info", "🔍 Verifying complete QtForge test coverage...")
+    yield Finding("info", f"📁 Test directory: {test_dir}")
+    yield Finding("info", f"📁 Source directory: {src_dir}")
 
     # Get all source modules
-    src_modules = []
-    if src_dir.exists():
-        for item in src_dir.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                src_modules.append(item.name)
+    src_modules = [
+        name for name, entry in _list_dir(src_dir).items()
+        if entry.is_dir() and not name.startswith('.')
+    ]
+    src_modules.sort()
 
-    print(f"\n📦 Found {len(src_modules)} source modules:")
-    for module in sorted(src_modules):
-        print(f"   - {module}")
+    yield Finding("info", f"\n📦 Found {len(src_modules)} source modules:", "src")
+    for module in src_modules:
+        yield Finding("info", f"   - {module}", "src")
 
     # Expected test modules (should match src modules)
-    expected_test_modules = set(src_modules)
-
-    # Add additional test modules that don't have direct src counterparts
-    expected_test_modules.update(['platform', 'integration', 'build_system'])
+    expected_test_modules = set(src_modules) | _EXTRA_TEST_MODULES
 
     # Get actual test modules
-    actual_test_modules = set()
-    for item in test_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.') and item.name != '__pycache__':
-            actual_test_modules.add(item.name)
+    test_entries, scans = _discover_test_modules(test_dir)
+    actual_test_modules = set(scans)
+
+    sorted_actual = sorted(actual_test_modules)
 
-    print(f"\n🧪 Found {len(actual_test_modules)} test modules:")
-    for module in sorted(actual_test_modules):
-        print(f"   - {module}")
+    yield Finding("info", f"\n🧪 Found {len(actual_test_modules)} test modules:", "tests")
+    for module in sorted_actual:
+        yield Finding("info", f"   - {module}", "tests")
 
     # Check coverage
     missing_modules = expected_test_modules - actual_test_modules
     extra_modules = actual_test_modules - expected_test_modules
+    covered = actual_test_modules & expected_test_modules
+    expected_n = len(expected_test_modules)
 
-    print(f"\n📊 Coverage Analysis:")
-    print(f"   Expected modules: {len(expected_test_modules)}")
-    print(f"   Actual modules: {len(actual_test_modules)}")
-    print(f"   Coverage: {len(actual_test_modules & expected_test_modules)}/{len(expected_test_modules)} ({100 * len(actual_test_modules & expected_test_modules) / len(expected_test_modules):.1f}%)")
+    yield Finding("info", f"\n📊 Coverage Analysis:", "coverage")
+    yield Finding("info", f"   Expected modules: {expected_n}", "coverage")
+    yield Finding("info", f"   Actual modules: {len(actual_test_modules)}", "coverage")
+    yield Finding(
+        "info",
+        f"   Coverage: {len(covered)}/{expected_n} ({100 * len(covered) / expected_n:.1f}%)",
+        "coverage")
 
     # Report missing modules
     if missing_modules:
-        print(f"\n❌ Missing test modules ({len(missing_modules)}):")
+        yield Finding("info", f"\n❌ Missing test modules ({len(missing_modules)}):", "coverage")
         for module in sorted(missing_modules):
-            print(f"   - {module}")
+            yield Finding("error", f"   - {module}", module)
 
     # Report extra modules
     if extra_modules:
-        print(f"\n➕ Extra test modules ({len(extra_modules)}):")
+        yield Finding("info", f"\n➕ Extra test modules ({len(extra_modules)}):", "coverage")
         for module in sorted(extra_modules):
-            print(f"   - {module}")
+            yield Finding("info", f"   - {module}", module)
+
+    if quick and missing_modules:
+        yield stop_early()
+        return
+
+    # Nothing to walk if no expected test module exists at all
+    if not actual_test_modules or missing_modules == expected_test_modules:
+        yield Finding("error", "\n❌ No test modules found — skipping the structure checks",
+                      "structure")
+        return
 
     # Verify each test module has proper structure
-    print(f"\n🔧 Verifying test module structure:")
+    yield Finding("info", f"\n🔧 Verifying test module structure:", "structure")
 
     structure_issues = []
+    # Directory listing of each test module, reused by the later checks
+    module_files = {}
 
-    for module in sorted(actual_test_modules):
-        module_path = test_dir / module
-        cmake_file = module_path / "CMakeLists.txt"
+    for module in sorted_actual:
+        scan = scans[module]
+        module_files[module] = scan.files
 
-        print(f"\n   📂 {module}:")
+        yield Finding("info", f"\n   📂 {module}:", module)
 
         # Check CMakeLists.txt
-        if cmake_file.exists():
-            print(f"      ✅ CMakeLists.txt")
+        if scan.has_cmake:
+            yield Finding("ok", f"      ✅ CMakeLists.txt", module)
         else:
-            print(f"      ❌ Missing CMakeLists.txt")
             structure_issues.append(f"Missing CMakeLists.txt in {module}")
+            yield Finding("error", f"      ❌ Missing CMakeLists.txt", module)
 
         # Check for test files
-        test_files = list(module_path.glob("test_*.cpp"))
+        test_files = scan.test_files
         if test_files:
-            print(f"      ✅ {len(test_files)} test file(s):")
-            for test_file in sorted(test_files):
-                print(f"         - {test_file.name}")
+            yield Finding("ok", f"      ✅ {len(test_files)} test file(s):", module)
+            for test_file in test_files:
+                yield Finding("info", f"         - {test_file}", module)
         else:
-            print(f"      ⚠️  No test files found")
             # This might be OK for placeholder modules
+            yield Finding("warning", f"      ⚠️  No test files found", module)
+
+    if quick and structure_issues:
+        yield stop_early()
+        return
 
     # Check newly created test files
-    print(f"\n🆕 Verifying newly created test files:")
+    yield Finding("info", f"\n🆕 Verifying newly created test files:", "new_files")
 
     new_test_files = {
         'bridges': ['test_python_bridge.cpp'],
@@ -106,77 +247,159 @@ def verify_complete_coverage() -> None:
     }
 
     for module, expected_files in new_test_files.items():
-        module_path = test_dir / module
-        print(f"\n   📂 {module}:")
+        # Every existing module directory was listed during the structure walk
+        files = module_files.get(module)
+        yield Finding("info", f"\n   📂 {module}:", module)
 
-        if not module_path.exists():
-            print(f"      ❌ Module directory missing")
+        if files is None:
             structure_issues.append(f"Missing module directory: {module}")
+            yield Finding("error", f"      ❌ Module directory missing", module)
             continue
 
         for expected_file in expected_files:
-            test_file = module_path / expected_file
-            if test_file.exists():
+            entry = files.get(expected_file)
+            if entry is not None:
                 # Check file size to ensure it's not empty
-                file_size = test_file.stat().st_size
+                file_size = entry.stat().st_size
                 if file_size > 1000:  # At least 1KB
-                    print(f"      ✅ {expected_file} ({file_size:,} bytes)")
+                    yield Finding("ok", f"      ✅ {expected_file} ({file_size:,} bytes)", module)
                 else:
-                    print(
-                        f"      ⚠️  {expected_file} (too small: {file_size} bytes)")
+                    yield Finding(
+                        "warning",
+                        f"      ⚠️  {expected_file} (too small: {file_size} bytes)", module)
             else:
-                print(f"      ❌ Missing {expected_file}")
                 structure_issues.append(
                     f"Missing test file: {module}/{expected_file}")
+                yield Finding("error", f"      ❌ Missing {expected_file}", module)
+
+    if quick and structure_issues:
+        yield stop_early()
+        return
 
     # Check main CMakeLists.txt includes all modules
-    print(f"\n📋 Verifying main CMakeLists.txt:")
+    yield Finding("info", f"\n📋 Verifying main CMakeLists.txt:", "cmake")
 
-    main_cmake = test_dir / "CMakeLists.txt"
-    if main_cmake.exists():
-        content = main_cmake.read_text()
+    main_cmake = test_entries.get("CMakeLists.txt")
+    if main_cmake is not None:
+        with open(main_cmake.path) as f:
+            content = f.read()
+        declared = set(_ADD_SUBDIRECTORY_RE.findall(content))
 
-        missing_includes = []
-        for module in sorted(actual_test_modules):
-            if f"add_subdirectory({module})" not in content:
-                missing_includes.append(module)
+        missing_includes = [
+            module for module in sorted_actual
+            if module not in declared
+        ]
 
         if missing_includes:
-            print(f"   ❌ Missing subdirectory includes:")
+            yield Finding("info", f"   ❌ Missing subdirectory includes:", "cmake")
             for module in missing_includes:
-                print(f"      - add_subdirectory({module})")
                 structure_issues.append(
                     f"Missing add_subdirectory({module}) in main CMakeLists.txt")
+                yield Finding("error", f"      - add_subdirectory({module})", "cmake")
         else:
-            print(f"   ✅ All modules included in main CMakeLists.txt")
+            yield Finding("ok", f"   ✅ All modules included in main CMakeLists.txt", "cmake")
     else:
-        print(f"   ❌ Main CMakeLists.txt not found")
         structure_issues.append("Missing main CMakeLists.txt")
+        yield Finding("error", f"   ❌ Main CMakeLists.txt not found", "cmake")
 
-    # Summary
-    print(f"\n📈 Final Summary:")
+    # Summary; the issues listed here were already reported as errors above
+    yield Finding("info", f"\n📈 Final Summary:", "summary")
 
     if not missing_modules and not structure_issues:
-        print(f"   🎉 SUCCESS: Complete test coverage achieved!")
-        print(
-            f"   ✅ All {len(expected_test_modules)} modules have test coverage")
-        print(f"   ✅ All new test files created successfully")
-        print(f"   ✅ All CMakeLists.txt files properly configured")
-        return True
+        yield Finding("ok", f"   🎉 SUCCESS: Complete test coverage achieved!", "summary")
+        yield Finding("ok", f"   ✅ All {expected_n} modules have test coverage", "summary")
+        yield Finding("ok", f"   ✅ All new test files created successfully", "summary")
+        yield Finding("ok", f"   ✅ All CMakeLists.txt files properly configured", "summary")
     else:
-        print(f"   ⚠️  Issues found:")
+        yield Finding("info", f"   ⚠️  Issues found:", "summary")
 
         if missing_modules:
-            print(f"   - {len(missing_modules)} missing test modules")
+            yield Finding("info", f"   - {len(missing_modules)} missing test modules", "summary")
 
         if structure_issues:
-            print(f"   - {len(structure_issues)} structure issues:")
+            yield Finding("info", f"   - {len(structure_issues)} structure issues:", "summary")
             for issue in structure_issues:
-                print(f"     • {issue}")
+                yield Finding("info", f"     • {issue}", "summary")
+        return
+
+    if watched is not None:
+        # Directory mtimes cover added/removed entries; the checked test
+        # files and the main CMakeLists.txt also need their own
+        watched += [src_dir, test_dir, main_cmake.path]
+        watched += [test_entries[module].path for module in sorted_actual]
+        watched += [
+            module_files[module][name].path
+            for module, expected_files in new_test_files.items()
+            for name in expected_files
+        ]
+
+
+def _finding_to_json(finding: Finding) -> str:
+    """Render a Finding as one JSON line, without the report's layout."""
+    return json.dumps({
+        "level": finding.level,
+        "scope": finding.scope,
+        "message": finding.message.strip(),
+    }, ensure_ascii=False)
+
+
+def verify_complete_coverage(quick: bool = False, use_cache: bool = True,
+                             as_json: bool = False) -> bool:
+    """Verify complete test coverage for all QtForge modules.
+
+    With ``quick``, stop after the first check phase that reports an issue
+    instead of running every check. With ``use_cache``, a successful result
+    is reused until one of the inspected directories or files changes. With
+    ``as_json``, each finding is printed as a JSON object per line instead
+    of the human-readable report.
+    """
+    # Go up one level since we're now in utils/
+    test_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    src_dir = os.path.join(os.path.dirname(test_dir), "src")
+    cache_file = os.path.join(test_dir, CACHE_FILENAME)
+
+    if use_cache and _cache_is_fresh(cache_file):
+        finding = Finding(
+            "ok",
+            "✅ Test coverage unchanged since the last successful verification "
+            "(use --no-cache to re-run)",
+            "cache")
+        sys.stdout.write(
+            (_finding_to_json(finding) if as_json else finding.message) + "\n")
+        return True
 
-        return False
+    watched = [] if use_cache else None
+    findings = list(_iter_findings(test_dir, src_dir, quick, watched))
+    # The report is written in one go
+    if as_json:
+        lines = [_finding_to_json(finding) for finding in findings]
+    else:
+        lines = [finding.message for finding in findings]
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+
+    success = all(f.level != "error" for f in findings)
+    if success and watched:
+        _write_cache(cache_file, watched)
+
+    return success
 
 
 if __name__ == "__main__":
-    success = verify_complete_coverage()
+    parser = argparse.ArgumentParser(
+        description="Verify complete QtForge test coverage")
+    parser.add_argument(
+        "--quick", action="store_true",
+        help="Stop at the first failed check (useful as a CI/pre-commit gate)")
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Ignore and do not update tests/{CACHE_FILENAME}")
+    parser.add_argument(
+        "--json", action="store_true",
+        help="Print one JSON object per finding instead of the text report")
+    args = parser.parse_args()
+
+    success = verify_complete_coverage(quick=args.quick,
+                                       use_cache=not args.no_cache,
+                                       as_json=args.json)
     sys.exit(0 if success else 1)
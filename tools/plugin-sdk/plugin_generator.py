@@ -6,445 +6,229 @@ A comprehensive tool for generating plugin projects with templates and scaffoldi
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import re
 import sys
+from collections import ChainMap
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+# Use orjson for metadata.json when installed; the output stays plain JSON
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Leading metadata.json fields as (field, variable, default); fields without
+# a default require the variable
+_METADATA_FIELDS = (
+    ("id", "plugin_id", None),
+    ("name", "name", None),
+    ("version", "version", None),
+    ("description", "description", None),
+    ("author", "author", None),
+    ("license", "license", "MIT"),
+    ("category", "category", "General"),
+)
 
-class PluginTemplate:
-    """Base class for plugin templates"""
-
-    def __init__(self, name: str, description: str) -> None:
-        self.name = name
-        self.description = description
-        self.variables: dict[str, Any] = {}
-
-    def set_variables(self, variables: dict[str, Any]) -> None:
-        """Set template variables"""
-        self.variables.update(variables)
-
-    def render_template(self, template_content: str) -> str:
-        """Render template with variables"""
-        for key, value in self.variables.items():
-            placeholder = f"{{{{{key}}}}}"
-            template_content = template_content.replace(placeholder, str(value))
-        return template_content
-
-    def generate_files(self, output_dir: Path) -> list[Path]:
-        """Generate files for this template"""
-        raise NotImplementedError
-
-
-class NativePluginTemplate(PluginTemplate):
-    """Template for native C++ plugins"""
-
-    def __init__(self) -> None:
-        super().__init__("native", "Native C++ plugin with full QtForge integration")
-
-    def generate_files(self, output_dir: Path) -> list[Path]:
-        """Generate native plugin files"""
-        generated_files = []
-
-        # Create directory structure
-        src_dir = output_dir / "src"
-        include_dir = output_dir / "include"
-        tests_dir = output_dir / "tests"
-
-        for dir_path in [src_dir, include_dir, tests_dir]:
-            dir_path.mkdir(parents=True, exist_ok=True)
-
-        # Generate header file
-        header_content = self._generate_header()
-        header_file = include_dir / f"{self.variables['class_name'].lower()}.hpp"
-        header_file.write_text(header_content)
-        generated_files.append(header_file)
-
-        # Generate source file
-        source_content = self._generate_source()
-        source_file = src_dir / f"{self.variables['class_name'].lower()}.cpp"
-        source_file.write_text(source_content)
-        generated_files.append(source_file)
-
-        # Generate CMakeLists.txt
-        cmake_content = self._generate_cmake()
-        cmake_file = output_dir / "CMakeLists.txt"
-        cmake_file.write_text(cmake_content)
-        generated_files.append(cmake_file)
-
-        # Generate metadata.json
-        metadata_content = self._generate_metadata()
-        metadata_file = output_dir / "metadata.json"
-        metadata_file.write_text(metadata_content)
-        generated_files.append(metadata_file)
-
-        # Generate test file
-        test_content = self._generate_test()
-        test_file = tests_dir / f"test_{self.variables['class_name'].lower()}.cpp"
-        test_file.write_text(test_content)
-        generated_files.append(test_file)
-
-        return generated_files
-
-    def _generate_header(self) -> str:
-        """Generate plugin header file"""
-        return self.render_template("""/**
- * @file {{class_name_lower}}.hpp
- * @brief {{description}}
- * @version {{version}}
- * @author {{author}}
- */
-
-#pragma once
-
-#include <qtplugin/interfaces/core/dynamic_plugin_interface.hpp>
-#include <QObject>
-#include <QString>
-#include <QJsonObject>
-#include <memory>
-
-class {{class_name}} : public QObject, public qtplugin::IDynamicPlugin {
-    Q_OBJECT
-    Q_PLUGIN_METADATA(IID "qtplugin.IDynamicPlugin/{{version}}" FILE "metadata.json")
-    Q_INTERFACES(qtplugin::IDynamicPlugin)
-
-public:
-    explicit {{class_name}}(QObject* parent = nullptr);
-    ~{{class_name}}() override;
-
-    // === IPlugin Implementation ===
-    std::string_view name() const noexcept override;
-    std::string_view description() const noexcept override;
-    qtplugin::Version version() const noexcept override;
-    std::string_view author() const noexcept override;
-    std::string id() const noexcept override;
-
-    qtplugin::expected<void, qtplugin::PluginError> initialize() override;
-    void shutdown() noexcept override;
-    qtplugin::PluginState state() const noexcept override;
-
-    qtplugin::PluginCapabilities capabilities() const noexcept override;
-
-    qtplugin::expected<void, qtplugin::PluginError> configure(
-        const QJsonObject& config) override;
-    QJsonObject current_configuration() const override;
-
-    qtplugin::expected<QJsonObject, qtplugin::PluginError> execute_command(
-        std::string_view command, const QJsonObject& params = {}) override;
-    std::vector<std::string> available_commands() const override;
-
-    // === IDynamicPlugin Implementation ===
-    std::vector<qtplugin::InterfaceDescriptor> get_interface_descriptors() const override;
-    bool supports_interface(const QString& interface_id,
-                           const qtplugin::Version& min_version = qtplugin::Version{}) const override;
-    std::optional<qtplugin::InterfaceDescriptor> get_interface_descriptor(
-        const QString& interface_id) const override;
-
-    qtplugin::expected<void, qtplugin::PluginError> adapt_to_interface(
-        const QString& interface_id, const qtplugin::Version& target_version) override;
-
-    qtplugin::PluginType get_plugin_type() const override;
-    qtplugin::PluginExecutionContext get_execution_context() const override;
-
-    qtplugin::expected<QVariant, qtplugin::PluginError> execute_code(
-        const QString& code, const QJsonObject& context = {}) override;
-
-    qtplugin::expected<QVariant, qtplugin::PluginError> invoke_method(
-        const QString& method_name, const QVariantList& parameters = {},
-        const QString& interface_id = {}) override;
-
-private:
-    qtplugin::PluginState m_state{qtplugin::PluginState::Unloaded};
-    QJsonObject m_configuration;
-    std::vector<qtplugin::InterfaceDescriptor> m_interfaces;
-
-    void setup_interfaces();
-};
-""")
-
-    def _generate_source(self) -> str:
-        """Generate plugin source file"""
-        return self.render_template("""/**
- * @file {{class_name_lower}}.cpp
- * @brief Implementation of {{class_name}}
- * @version {{version}}
- */
-
-#include "../include/{{class_name_lower}}.hpp"
-#include <QDebug>
-#include <QLoggingCategory>
-
-Q_LOGGING_CATEGORY({{class_name_lower}}Log, "{{plugin_id}}")
-
-{{class_name}}::{{class_name}}(QObject* parent)
-    : QObject(parent) {
-    setup_interfaces();
-}
-
-{{class_name}}::~{{class_name}}() {
-    if (m_state != qtplugin::PluginState::Unloaded) {
-        shutdown();
+# Variable defaults, shared read-only by every generation
+_DEFAULT_VARIABLES: Mapping[str, str] = MappingProxyType(
+    {
+        "version": "1.0.0",
+        "author": "Plugin Developer",
+        "license": "MIT",
+        "category": "General",
+        "capability": "Service",
     }
-}
-
-std::string_view {{class_name}}::name() const noexcept {
-    return "{{name}}";
-}
-
-std::string_view {{class_name}}::description() const noexcept {
-    return "{{description}}";
-}
-
-qtplugin::Version {{class_name}}::version() const noexcept {
-    return qtplugin::Version::from_string("{{version}}").value_or(qtplugin::Version{});
-}
-
-std::string_view {{class_name}}::author() const noexcept {
-    return "{{author}}";
-}
+)
 
-std::string {{class_name}}::id() const noexcept {
-    return "{{plugin_id}}";
-}
+# Domain prefix of derived plugin ids
+_PLUGIN_ID_PREFIX = "com.example."
 
-qtplugin::expected<void, qtplugin::PluginError> {{class_name}}::initialize() {
-    if (m_state != qtplugin::PluginState::Unloaded) {
-        return qtplugin::make_error<void>(qtplugin::PluginErrorCode::InvalidState,
-                                         "Plugin already initialized");
-    }
+# Plugin file templates, shipped next to this script
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
 
-    m_state = qtplugin::PluginState::Loading;
+# Matches a {{variable}} placeholder in a template
+_PLACEHOLDER_RE = re.compile(r"\{\{([A-Za-z_]\w*)\}\}")
 
-    // TODO: Add your initialization code here
 
-    m_state = qtplugin::PluginState::Running;
-    qCDebug({{class_name_lower}}Log) << "Plugin initialized successfully";
+@functools.lru_cache(maxsize=None)
+def _compile_template(template_content: str) -> str:
+    """Convert a {{variable}} template into a str.format_map() format string
 
-    return qtplugin::make_success();
-}
+    Literal braces (plentiful in C++ and Python sources) are escaped and
+    each placeholder becomes a {variable} field. Templates are constants, so
+    each one is converted once and reused for every render.
+    """
+    parts = _PLACEHOLDER_RE.split(template_content)
+    # split() alternates literal text and placeholder names
+    for i in range(0, len(parts), 2):
+        parts[i] = parts[i].replace("{", "{{").replace("}", "}}")
+    for i in range(1, len(parts), 2):
+        parts[i] = f"{{{parts[i]}}}"
+    return "".join(parts)
 
-void {{class_name}}::shutdown() noexcept {
-    if (m_state == qtplugin::PluginState::Unloaded) {
-        return;
-    }
 
-    m_state = qtplugin::PluginState::Stopping;
+@functools.lru_cache(maxsize=None)
+def _load_template(name: str) -> str:
+    """Read a template from the templates directory, once per run"""
+    return (_TEMPLATE_DIR / name).read_bytes().decode("utf-8")
 
-    // TODO: Add your cleanup code here
 
-    m_state = qtplugin::PluginState::Unloaded;
-    qCDebug({{class_name_lower}}Log) << "Plugin shutdown completed";
-}
+def _dump_metadata(metadata: dict[str, Any]) -> bytes:
+    """Serialize plugin metadata as indented UTF-8 JSON bytes
 
-qtplugin::PluginState {{class_name}}::state() const noexcept {
-    return m_state;
-}
+    Non-ASCII text is written unescaped on both paths, as orjson always
+    does, so the output does not depend on whether orjson is installed.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    return json.dumps(metadata, indent=2, ensure_ascii=False).encode("utf-8")
 
-qtplugin::PluginCapabilities {{class_name}}::capabilities() const noexcept {
-    return qtplugin::PluginCapability::{{capability}};
-}
 
-qtplugin::expected<void, qtplugin::PluginError> {{class_name}}::configure(
-    const QJsonObject& config) {
+@functools.lru_cache(maxsize=None)
+def _generation_timestamp() -> str:
+    """Timestamp of this generator run, shared by every generated file"""
+    return datetime.now().isoformat()
 
-    m_configuration = config;
 
-    // TODO: Process configuration
+class _TemplateVariables(dict):
+    """Variables for format_map() that leave unknown placeholders in place"""
 
-    return qtplugin::make_success();
-}
+    def __missing__(self, key: str) -> str:
+        return f"{{{{{key}}}}}"
 
-QJsonObject {{class_name}}::current_configuration() const {
-    return m_configuration;
-}
 
-qtplugin::expected<QJsonObject, qtplugin::PluginError> {{class_name}}::execute_command(
-    std::string_view command, const QJsonObject& params) {
+@functools.lru_cache(maxsize=256)
+def _render(template_content: str, variables: tuple[tuple[str, str], ...]) -> str:
+    """Render a template for a sorted snapshot of its variables
 
-    QString cmd = QString::fromUtf8(command.data(), command.size());
+    Batch generation often repeats the same template and variables, so
+    renders are memoized on the (hashable) snapshot.
+    """
+    return _compile_template(template_content).format_map(
+        _TemplateVariables(variables)
+    )
 
-    if (cmd == "status") {
-        QJsonObject result;
-        result["state"] = static_cast<int>(m_state);
-        result["name"] = QString::fromStdString(std::string(name()));
-        return result;
-    }
 
-    // TODO: Add your commands here
+class PluginTemplate:
+    """Base class for plugin templates"""
 
-    return qtplugin::make_error<QJsonObject>(qtplugin::PluginErrorCode::CommandNotFound,
-                                            "Unknown command: " + std::string(command));
-}
+    __slots__ = ("name", "description", "variables")
 
-std::vector<std::string> {{class_name}}::available_commands() const {
-    return {"status"};
-}
+    def __init__(self, name: str, description: str) -> None:
+        self.name = name
+        self.description = description
+        self.variables: dict[str, Any] = {}
 
-// === IDynamicPlugin Implementation ===
+    def set_variables(self, variables: Mapping[str, Any]) -> None:
+        """Set template variables"""
+        self.variables.update(variables)
 
-std::vector<qtplugin::InterfaceDescriptor> {{class_name}}::get_interface_descriptors() const {
-    return m_interfaces;
-}
+    def render_template(self, template_content: str) -> str:
+        """Render template with variables
 
-bool {{class_name}}::supports_interface(const QString& interface_id,
-                                       const qtplugin::Version& min_version) const {
-    for (const auto& interface : m_interfaces) {
-        if (interface.interface_id == interface_id && interface.version >= min_version) {
-            return true;
-        }
-    }
-    return false;
-}
+        All placeholders are substituted in a single pass, so substituted
+        values are never rescanned; unknown placeholders are left as is.
+        """
+        variables = tuple(
+            sorted((key, str(value)) for key, value in self.variables.items())
+        )
+        return _render(template_content, variables)
 
-std::optional<qtplugin::InterfaceDescriptor> {{class_name}}::get_interface_descriptor(
-    const QString& interface_id) const {
+    def generate_files(self, output_dir: Path) -> list[Path]:
+        """Generate files for this template"""
+        raise NotImplementedError
 
-    for (const auto& interface : m_interfaces) {
-        if (interface.interface_id == interface_id) {
-            return interface;
+    def _common_metadata(self) -> dict[str, Any]:
+        """metadata.json fields shared by every template, in file order"""
+        variables = self.variables
+        return {
+            field: variables[name] if default is None else variables.get(name, default)
+            for field, name, default in _METADATA_FIELDS
         }
-    }
-    return std::nullopt;
-}
-
-qtplugin::expected<void, qtplugin::PluginError> {{class_name}}::adapt_to_interface(
-    const QString& interface_id, const qtplugin::Version& target_version) {
-
-    // TODO: Implement interface adaptation logic
-    return qtplugin::make_success();
-}
 
-qtplugin::PluginType {{class_name}}::get_plugin_type() const {
-    return qtplugin::PluginType::Native;
-}
-
-qtplugin::PluginExecutionContext {{class_name}}::get_execution_context() const {
-    return qtplugin::PluginTypeUtils::get_default_context(qtplugin::PluginType::Native);
-}
+    @staticmethod
+    def _write_files(files: list[tuple[Path, bytes]]) -> list[Path]:
+        """Write rendered files concurrently and return their paths in order
 
-qtplugin::expected<QVariant, qtplugin::PluginError> {{class_name}}::execute_code(
-    const QString& code, const QJsonObject& context) {
+        The writes are independent, so overlapping them hides per-file
+        latency on slow or networked filesystems.
+        """
+        with ThreadPoolExecutor(max_workers=len(files) or 1) as executor:
+            # list() propagates the first write error
+            list(executor.map(lambda item: item[0].write_bytes(item[1]), files))
+        return [path for path, _ in files]
 
-    Q_UNUSED(code)
-    Q_UNUSED(context)
 
-    return qtplugin::make_error<QVariant>(qtplugin::PluginErrorCode::NotSupported,
-                                         "Code execution not supported for native plugins");
-}
+class NativePluginTemplate(PluginTemplate):
+    """Template for native C++ plugins"""
 
-qtplugin::expected<QVariant, qtplugin::PluginError> {{class_name}}::invoke_method(
-    const QString& method_name, const QVariantList& parameters,
-    const QString& interface_id) {
+    __slots__ = ()
 
-    Q_UNUSED(method_name)
-    Q_UNUSED(parameters)
-    Q_UNUSED(interface_id)
+    def __init__(self) -> None:
+        super().__init__("native", "Native C++ plugin with full QtForge integration")
 
-    // TODO: Implement dynamic method invocation
-    return qtplugin::make_error<QVariant>(qtplugin::PluginErrorCode::CommandNotFound,
-                                         "Method not found: " + method_name.toStdString());
-}
+    def generate_files(self, output_dir: Path) -> list[Path]:
+        """Generate native plugin files"""
+        # Create directory structure
+        src_dir = output_dir / "src"
+        include_dir = output_dir / "include"
+        tests_dir = output_dir / "tests"
 
-void {{class_name}}::setup_interfaces() {
-    // TODO: Define your plugin interfaces here
-    qtplugin::InterfaceDescriptor interface;
-    interface.interface_id = "{{plugin_id}}.main";
-    interface.version = version();
-    interface.description = QString::fromStdString(std::string(description()));
+        for dir_path in [src_dir, include_dir, tests_dir]:
+            dir_path.mkdir(parents=True, exist_ok=True)
 
-    m_interfaces.push_back(interface);
-}
+        # The templates name their files after class_name_lower too, so the
+        # file names must come from the same variable
+        class_name_lower = self.variables.setdefault(
+            "class_name_lower", self.variables["class_name"].lower()
+        )
+
+        # Render every file first, then write them all
+        files = [
+            # Header file
+            (
+                include_dir / f"{class_name_lower}.hpp",
+                self._generate_header(),
+            ),
+            # Source file
+            (
+                src_dir / f"{class_name_lower}.cpp",
+                self._generate_source(),
+            ),
+            (output_dir / "CMakeLists.txt", self._generate_cmake()),
+            (output_dir / "metadata.json", self._generate_metadata()),
+            # Test file
+            (
+                tests_dir / f"test_{class_name_lower}.cpp",
+                self._generate_test(),
+            ),
+        ]
+        return self._write_files(files)
+
+    def _generate_header(self) -> bytes:
+        """Generate plugin header file"""
+        return self.render_template(_load_template("native_header.hpp.tpl")).encode()
 
-#include "{{class_name_lower}}.moc"
-""")
+    def _generate_source(self) -> bytes:
+        """Generate plugin source file"""
+        return self.render_template(_load_template("native_source.cpp.tpl")).encode()
 
-    def _generate_cmake(self) -> str:
+    def _generate_cmake(self) -> bytes:
         """Generate CMakeLists.txt"""
-        return self.render_template("""cmake_minimum_required(VERSION 3.21)
-project({{project_name}} VERSION {{version}} LANGUAGES CXX)
-
-# Set C++20 standard
-set(CMAKE_CXX_STANDARD 20)
-set(CMAKE_CXX_STANDARD_REQUIRED ON)
-
-# Find required packages
-find_package(Qt6 REQUIRED COMPONENTS Core)
-find_package(QtForge REQUIRED COMPONENTS Core)
-
-# Create the plugin
-add_library({{target_name}} MODULE
-    src/{{class_name_lower}}.cpp
-    include/{{class_name_lower}}.hpp
-)
-
-# Set plugin properties
-set_target_properties({{target_name}} PROPERTIES
-    PREFIX ""
-    SUFFIX ".qtplugin"
-    AUTOMOC ON
-    OUTPUT_NAME {{plugin_name}}
-)
-
-# Link libraries
-target_link_libraries({{target_name}}
-    PRIVATE
-        Qt6::Core
-        QtForge::Core
-)
-
-# Include directories
-target_include_directories({{target_name}}
-    PRIVATE
-        include
-)
-
-# Install plugin
-install(TARGETS {{target_name}}
-    LIBRARY DESTINATION plugins
-)
+        return self.render_template(_load_template("native_cmake.txt.tpl")).encode()
 
-# Install metadata
-install(FILES metadata.json
-    DESTINATION plugins
-    RENAME {{plugin_name}}.json
-)
-
-# Tests (optional)
-if(BUILD_TESTING)
-    find_package(Qt6 REQUIRED COMPONENTS Test)
-
-    add_executable({{target_name}}_test
-        tests/test_{{class_name_lower}}.cpp
-        src/{{class_name_lower}}.cpp
-    )
-
-    target_link_libraries({{target_name}}_test
-        PRIVATE
-            Qt6::Core
-            Qt6::Test
-            QtForge::Core
-    )
-
-    target_include_directories({{target_name}}_test
-        PRIVATE
-            include
-    )
-
-    add_test(NAME {{target_name}}_test COMMAND {{target_name}}_test)
-endif()
-""")
-
-    def _generate_metadata(self) -> str:
+    def _generate_metadata(self) -> bytes:
         """Generate metadata.json"""
         metadata = {
-            "id": self.variables["plugin_id"],
-            "name": self.variables["name"],
-            "version": self.variables["version"],
-            "description": self.variables["description"],
-            "author": self.variables["author"],
-            "license": self.variables.get("license", "MIT"),
-            "category": self.variables.get("category", "General"),
+            **self._common_metadata(),
             "capabilities": [self.variables.get("capability", "Service")],
             "dependencies": [],
             "interfaces": [
@@ -455,377 +239,53 @@ endif()
                 }
             ],
             "generated": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _generation_timestamp(),
                 "generator": "QtForge Plugin Generator v1.0",
                 "template": "native",
             },
         }
-        return json.dumps(metadata, indent=2)
+        return _dump_metadata(metadata)
 
-    def _generate_test(self) -> str:
+    def _generate_test(self) -> bytes:
         """Generate test file"""
-        return self.render_template("""/**
- * @file test_{{class_name_lower}}.cpp
- * @brief Unit tests for {{class_name}}
- */
-
-#include <QtTest/QtTest>
-#include <QObject>
-#include "../include/{{class_name_lower}}.hpp"
-
-class Test{{class_name}} : public QObject {
-    Q_OBJECT
-
-private slots:
-    void initTestCase();
-    void cleanupTestCase();
-    void testInitialization();
-    void testCommands();
-    void testConfiguration();
-
-private:
-    std::unique_ptr<{{class_name}}> m_plugin;
-};
-
-void Test{{class_name}}::initTestCase() {
-    m_plugin = std::make_unique<{{class_name}}>();
-}
-
-void Test{{class_name}}::cleanupTestCase() {
-    m_plugin.reset();
-}
-
-void Test{{class_name}}::testInitialization() {
-    QCOMPARE(m_plugin->state(), qtplugin::PluginState::Unloaded);
-
-    auto result = m_plugin->initialize();
-    QVERIFY(result.has_value());
-    QCOMPARE(m_plugin->state(), qtplugin::PluginState::Running);
-
-    m_plugin->shutdown();
-    QCOMPARE(m_plugin->state(), qtplugin::PluginState::Unloaded);
-}
-
-void Test{{class_name}}::testCommands() {
-    m_plugin->initialize();
-
-    auto commands = m_plugin->available_commands();
-    QVERIFY(!commands.empty());
-    QVERIFY(std::find(commands.begin(), commands.end(), "status") != commands.end());
-
-    auto result = m_plugin->execute_command("status");
-    QVERIFY(result.has_value());
-
-    auto status = result.value();
-    QVERIFY(status.contains("state"));
-    QVERIFY(status.contains("name"));
-}
-
-void Test{{class_name}}::testConfiguration() {
-    QJsonObject config;
-    config["test_setting"] = "test_value";
-
-    auto result = m_plugin->configure(config);
-    QVERIFY(result.has_value());
-
-    auto current_config = m_plugin->current_configuration();
-    QCOMPARE(current_config["test_setting"].toString(), QString("test_value"));
-}
-
-QTEST_MAIN(Test{{class_name}})
-#include "test_{{class_name_lower}}.moc"
-""")
+        return self.render_template(_load_template("native_test.cpp.tpl")).encode()
 
 
 class PythonPluginTemplate(PluginTemplate):
     """Template for Python script plugins"""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__("python", "Python script plugin with QtForge integration")
 
     def generate_files(self, output_dir: Path) -> list[Path]:
         """Generate Python plugin files"""
-        generated_files = []
-
-        # Generate main plugin file
-        plugin_content = self._generate_plugin()
-        plugin_file = output_dir / f"{self.variables['plugin_name']}.py"
-        plugin_file.write_text(plugin_content)
-        generated_files.append(plugin_file)
-
-        # Generate metadata.json
-        metadata_content = self._generate_metadata()
-        metadata_file = output_dir / "metadata.json"
-        metadata_file.write_text(metadata_content)
-        generated_files.append(metadata_file)
-
-        # Generate requirements.txt
-        requirements_content = self._generate_requirements()
-        requirements_file = output_dir / "requirements.txt"
-        requirements_file.write_text(requirements_content)
-        generated_files.append(requirements_file)
-
-        # Generate test file
-        test_content = self._generate_test()
-        test_file = output_dir / f"test_{self.variables['plugin_name']}.py"
-        test_file.write_text(test_content)
-        generated_files.append(test_file)
-
-        return generated_files
-
-    def _generate_plugin(self) -> str:
+        files = [
+            # Main plugin file
+            (
+                output_dir / f"{self.variables['plugin_name']}.py",
+                self._generate_plugin(),
+            ),
+            (output_dir / "metadata.json", self._generate_metadata()),
+            (output_dir / "requirements.txt", self._generate_requirements()),
+            (output_dir / "conftest.py", self._generate_conftest()),
+            # Test file
+            (
+                output_dir / f"test_{self.variables['plugin_name']}.py",
+                self._generate_test(),
+            ),
+        ]
+        return self._write_files(files)
+
+    def _generate_plugin(self) -> bytes:
         """Generate Python plugin file"""
-        return self.render_template('''#!/usr/bin/env python3
-"""
-{{name}} - {{description}}
-Version: {{version}}
-Author: {{author}}
-"""
-
-import json
-import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger("{{plugin_id}}")
-
-class {{class_name}}:
-    """{{description}}"""
-
-    def __init__(self) -> None:
-        self.state = "unloaded"
-        self.configuration = {}
-        self.interfaces = []
-        self._setup_interfaces()
-
-    # === Plugin Interface ===
-
-    def name(self) -> str:
-        return "{{name}}"
-
-    def description(self) -> str:
-        return "{{description}}"
-
-    def version(self) -> str:
-        return "{{version}}"
-
-    def author(self) -> str:
-        return "{{author}}"
-
-    def id(self) -> str:
-        return "{{plugin_id}}"
-
-    def initialize(self) -> Dict[str, Any]:
-        """Initialize the plugin"""
-        if self.state != "unloaded":
-            return {"success": False, "error": "Plugin already initialized"}
-
-        self.state = "loading"
-
-        try:
-            # TODO: Add your initialization code here
-            logger.info(f"Initializing plugin {self.name()}")
-
-            self.state = "running"
-            logger.info("Plugin initialized successfully")
-            return {"success": True}
+        return self.render_template(_load_template("python_plugin.py.tpl")).encode()
 
-        except Exception as e:
-            self.state = "error"
-            logger.error(f"Failed to initialize plugin: {e}")
-            return {"success": False, "error": str(e)}
-
-    def shutdown(self) -> Dict[str, Any]:
-        """Shutdown the plugin"""
-        if self.state == "unloaded":
-            return {"success": True}
-
-        self.state = "stopping"
-
-        try:
-            # TODO: Add your cleanup code here
-            logger.info("Shutting down plugin")
-
-            self.state = "unloaded"
-            logger.info("Plugin shutdown completed")
-            return {"success": True}
-
-        except Exception as e:
-            logger.error(f"Error during shutdown: {e}")
-            return {"success": False, "error": str(e)}
-
-    def get_state(self) -> str:
-        return self.state
-
-    def capabilities(self) -> List[str]:
-        return ["{{capability}}"]
-
-    def configure(self, config: dict[str, Any]) -> dict[str, Any]:
-        """Configure the plugin"""
-        try:
-            self.configuration.update(config)
-            # TODO: Process configuration
-            logger.info("Plugin configured successfully")
-            return {"success": True}
-        except Exception as e:
-            logger.error(f"Configuration failed: {e}")
-            return {"success": False, "error": str(e)}
-
-    def current_configuration(self) -> Dict[str, Any]:
-        return self.configuration.copy()
-
-    def execute_command(self, command: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Execute a plugin command"""
-        if params is None:
-            params = {}
-
-        if command == "status":
-            return {
-                "success": True,
-                "result": {
-                    "state": self.state,
-                    "name": self.name(),
-                    "version": self.version()
-                }
-            }
-
-        # TODO: Add your commands here
-
-        return {"success": False, "error": f"Unknown command: {command}"}
-
-    def available_commands(self) -> List[str]:
-        return ["status"]
-
-    # === Dynamic Plugin Interface ===
-
-    def get_interface_descriptors(self) -> List[Dict[str, Any]]:
-        """Get supported interface descriptors"""
-        return [interface for interface in self.interfaces]
-
-    def supports_interface(self, interface_id: str, min_version: str = "0.0.0") -> bool:
-        """Check if plugin supports a specific interface"""
-        for interface in self.interfaces:
-            if interface["interface_id"] == interface_id:
-                # Simple version comparison (you might want to use a proper version library)
-                return interface["version"] >= min_version
-        return False
-
-    def get_interface_descriptor(self, interface_id: str) -> Optional[Dict[str, Any]]:
-        """Get interface descriptor by ID"""
-        for interface in self.interfaces:
-            if interface["interface_id"] == interface_id:
-                return interface
-        return None
-
-    def get_plugin_type(self) -> str:
-        return "python"
-
-    def get_execution_context(self) -> Dict[str, Any]:
-        return {
-            "type": "python",
-            "interpreter_path": "python",
-            "timeout": 60000
-        }
-
-    def execute_code(self, code: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Execute Python code in plugin context"""
-        if context is None:
-            context = {}
-
-        try:
-            # Create a safe execution environment
-            safe_globals = {
-                "__builtins__": {
-                    "print": print,
-                    "len": len,
-                    "str": str,
-                    "int": int,
-                    "float": float,
-                    "bool": bool,
-                    "list": list,
-                    "dict": dict,
-                    "tuple": tuple,
-                    "set": set,
-                }
-            }
-            safe_globals.update(context)
-
-            # Execute the code
-            result = eval(code, safe_globals)
-            return {"success": True, "result": result}
-
-        except Exception as e:
-            logger.error(f"Code execution failed: {e}")
-            return {"success": False, "error": str(e)}
-
-    def invoke_method(self, method_name: str, parameters: list[Any] | None = None,
-                     interface_id: str = "") -> dict[str, Any]:
-        """Invoke a method dynamically"""
-        if parameters is None:
-            parameters = []
-
-        # Check if method exists
-        if hasattr(self, method_name):
-            try:
-                method = getattr(self, method_name)
-                if callable(method):
-                    result = method(*parameters)
-                    return {"success": True, "result": result}
-                else:
-                    return {"success": False, "error": f"{method_name} is not callable"}
-            except Exception as e:
-                return {"success": False, "error": str(e)}
-
-        return {"success": False, "error": f"Method not found: {method_name}"}
-
-    def _setup_interfaces(self) -> None:
-        """Setup plugin interfaces"""
-        interface = {
-            "interface_id": f"{self.id()}.main",
-            "version": self.version(),
-            "description": self.description(),
-            "capabilities": [],
-            "schema": {},
-            "metadata": {}
-        }
-        self.interfaces.append(interface)
-
-# Plugin entry point
-def create_plugin() -> None:
-    """Create and return plugin instance"""
-    return {{class_name}}()
-
-# For testing
-if __name__ == "__main__":
-    plugin = create_plugin()
-    print(f"Plugin: {plugin.name()} v{plugin.version()}")
-    print(f"Description: {plugin.description()}")
-
-    # Test initialization
-    result = plugin.initialize()
-    print(f"Initialize: {result}")
-
-    # Test command execution
-    status = plugin.execute_command("status")
-    print(f"Status: {status}")
-
-    # Test shutdown
-    shutdown_result = plugin.shutdown()
-    print(f"Shutdown: {shutdown_result}")
-''')
-
-    def _generate_metadata(self) -> str:
+    def _generate_metadata(self) -> bytes:
         """Generate metadata.json for Python plugin"""
         metadata = {
-            "id": self.variables["plugin_id"],
-            "name": self.variables["name"],
-            "version": self.variables["version"],
-            "description": self.variables["description"],
-            "author": self.variables["author"],
-            "license": self.variables.get("license", "MIT"),
-            "category": self.variables.get("category", "General"),
+            **self._common_metadata(),
             "type": "python",
             "entry_point": f"{self.variables['plugin_name']}.py",
             "main_class": self.variables["class_name"],
@@ -840,146 +300,80 @@ if __name__ == "__main__":
                 }
             ],
             "generated": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _generation_timestamp(),
                 "generator": "QtForge Plugin Generator v1.0",
                 "template": "python",
             },
         }
-        return json.dumps(metadata, indent=2)
+        return _dump_metadata(metadata)
 
-    def _generate_requirements(self) -> str:
+    def _generate_requirements(self) -> bytes:
         """Generate requirements.txt"""
-        return """# QtForge Python Plugin Requirements
+        return b"""# QtForge Python Plugin Requirements
 qtforge-python-bridge>=1.0.0
 """
 
-    def _generate_test(self) -> str:
-        """Generate test file"""
-        return self.render_template('''#!/usr/bin/env python3
-"""
-Unit tests for {{class_name}}
-"""
-
-import unittest
-import sys
+    def _generate_conftest(self) -> bytes:
+        """Generate conftest.py"""
+        return b"""# Make the plugin importable from its tests once per pytest session,
+# whatever import mode pytest runs in
 import os
+import sys
 
-# Add the plugin directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+"""
 
-from {{plugin_name}} import {{class_name}}
-
-class Test{{class_name}}(unittest.TestCase):
-    """Test cases for {{class_name}}"""
-
-    def setUp(self) -> None:
-        """Set up test fixtures"""
-        self.plugin = {{class_name}}()
-
-    def tearDown(self) -> None:
-        """Clean up after tests"""
-        if self.plugin.get_state() != "unloaded":
-            self.plugin.shutdown()
-
-    def test_plugin_metadata(self) -> None:
-        """Test plugin metadata"""
-        self.assertEqual(self.plugin.name(), "{{name}}")
-        self.assertEqual(self.plugin.description(), "{{description}}")
-        self.assertEqual(self.plugin.version(), "{{version}}")
-        self.assertEqual(self.plugin.author(), "{{author}}")
-        self.assertEqual(self.plugin.id(), "{{plugin_id}}")
-
-    def test_initialization(self) -> None:
-        """Test plugin initialization"""
-        self.assertEqual(self.plugin.get_state(), "unloaded")
-
-        result = self.plugin.initialize()
-        self.assertTrue(result["success"])
-        self.assertEqual(self.plugin.get_state(), "running")
-
-        # Test double initialization
-        result = self.plugin.initialize()
-        self.assertFalse(result["success"])
-
-    def test_commands(self) -> None:
-        """Test command execution"""
-        self.plugin.initialize()
-
-        commands = self.plugin.available_commands()
-        self.assertIn("status", commands)
-
-        result = self.plugin.execute_command("status")
-        self.assertTrue(result["success"])
-        self.assertIn("result", result)
-        self.assertIn("state", result["result"])
-        self.assertIn("name", result["result"])
-
-    def test_configuration(self) -> None:
-        """Test plugin configuration"""
-        config = {"test_setting": "test_value"}
-        result = self.plugin.configure(config)
-        self.assertTrue(result["success"])
-
-        current_config = self.plugin.current_configuration()
-        self.assertEqual(current_config["test_setting"], "test_value")
-
-    def test_interfaces(self) -> None:
-        """Test interface support"""
-        interfaces = self.plugin.get_interface_descriptors()
-        self.assertGreater(len(interfaces), 0)
-
-        main_interface_id = f"{self.plugin.id()}.main"
-        self.assertTrue(self.plugin.supports_interface(main_interface_id))
-
-        descriptor = self.plugin.get_interface_descriptor(main_interface_id)
-        self.assertIsNotNone(descriptor)
-        self.assertEqual(descriptor["interface_id"], main_interface_id)
-
-    def test_code_execution(self) -> None:
-        """Test code execution"""
-        result = self.plugin.execute_code("2 + 2")
-        self.assertTrue(result["success"])
-        self.assertEqual(result["result"], 4)
-
-        # Test with context
-        context = {"x": 10}
-        result = self.plugin.execute_code("x * 2", context)
-        self.assertTrue(result["success"])
-        self.assertEqual(result["result"], 20)
-
-    def test_method_invocation(self) -> None:
-        """Test dynamic method invocation"""
-        result = self.plugin.invoke_method("name")
-        self.assertTrue(result["success"])
-        self.assertEqual(result["result"], "{{name}}")
-
-        # Test non-existent method
-        result = self.plugin.invoke_method("non_existent_method")
-        self.assertFalse(result["success"])
-
-if __name__ == "__main__":
-    unittest.main()
-''')
+    def _generate_test(self) -> bytes:
+        """Generate test file"""
+        return self.render_template(_load_template("python_test.py.tpl")).encode()
+
+
+@functools.lru_cache(maxsize=128)
+def _derive_names(name: str) -> tuple[str, str, str]:
+    """Derive (class_name, plugin_name, plugin_id) from a plugin name"""
+    # Convert name to class name (e.g., "My Plugin" -> "MyPlugin")
+    class_name = "".join(word.capitalize() for word in name.split())
+    lower_name = name.lower()
+    # Convert name to plugin name (e.g., "My Plugin" -> "my_plugin")
+    plugin_name = lower_name.replace(" ", "_")
+    # Generate plugin ID (e.g., "My Plugin" -> "com.example.myplugin")
+    plugin_id = _PLUGIN_ID_PREFIX + lower_name.replace(" ", "")
+    return class_name, plugin_name, plugin_id
+
+
+# Template classes keyed by template name
+PLUGIN_TEMPLATES: dict[str, type[PluginTemplate]] = {
+    "native": NativePluginTemplate,
+    "python": PythonPluginTemplate,
+}
 
 
 class PluginGenerator:
     """Main plugin generator class"""
 
     def __init__(self) -> None:
-        self.templates = {
-            "native": NativePluginTemplate(),
-            "python": PythonPluginTemplate(),
-        }
+        # Templates are instantiated on first use
+        self._factories = PLUGIN_TEMPLATES
+        self._templates: dict[str, PluginTemplate] = {}
+
+    def _get_template(self, template_name: str) -> PluginTemplate | None:
+        """Get the template instance for a name, creating it on first use"""
+        template = self._templates.get(template_name)
+        if template is None:
+            factory = self._factories.get(template_name)
+            if factory is None:
+                return None
+            template = self._templates[template_name] = factory()
+        return template
 
     def generate_plugin(
         self, template_name: str, output_dir: Path, variables: dict[str, Any]
     ) -> list[Path]:
         """Generate a plugin using the specified template"""
-        if template_name not in self.templates:
+        template = self._get_template(template_name)
+        if template is None:
             raise ValueError(f"Unknown template: {template_name}")
 
-        template = self.templates[template_name]
-
         # Set default variables
         default_variables = self._get_default_variables(variables)
         template.set_variables(default_variables)
@@ -992,56 +386,44 @@ class PluginGenerator:
 
         return generated_files
 
-    def _get_default_variables(self, user_variables: dict[str, Any]) -> dict[str, Any]:
-        """Get default variables with user overrides"""
-        defaults = {
-            "version": "1.0.0",
-            "author": "Plugin Developer",
-            "license": "MIT",
-            "category": "General",
-            "capability": "Service",
-        }
+    def _get_default_variables(
+        self, user_variables: dict[str, Any]
+    ) -> ChainMap[str, Any]:
+        """Get default variables with user overrides
 
-        # Merge user variables
-        defaults.update(user_variables)
+        User variables shadow the shared defaults without copying either;
+        derived variables are stored in the front map.
+        """
+        defaults: ChainMap[str, Any] = ChainMap({}, user_variables, _DEFAULT_VARIABLES)
 
         # Generate derived variables
-        if "name" in defaults and "class_name" not in defaults:
-            # Convert name to class name (e.g., "My Plugin" -> "MyPlugin")
-            defaults["class_name"] = "".join(
-                word.capitalize() for word in defaults["name"].split()
-            )
+        if "name" in defaults:
+            class_name, plugin_name, plugin_id = _derive_names(defaults["name"])
+            defaults.setdefault("class_name", class_name)
+            defaults.setdefault("plugin_name", plugin_name)
+            defaults.setdefault("plugin_id", plugin_id)
 
         if "class_name" in defaults and "class_name_lower" not in defaults:
             defaults["class_name_lower"] = defaults["class_name"].lower()
 
-        if "name" in defaults and "plugin_name" not in defaults:
-            # Convert name to plugin name (e.g., "My Plugin" -> "my_plugin")
-            defaults["plugin_name"] = defaults["name"].lower().replace(" ", "_")
-
         if "plugin_name" in defaults and "target_name" not in defaults:
             defaults["target_name"] = defaults["plugin_name"]
 
         if "plugin_name" in defaults and "project_name" not in defaults:
             defaults["project_name"] = defaults["plugin_name"].replace("_", "-")
 
-        if "name" in defaults and "plugin_id" not in defaults:
-            # Generate plugin ID (e.g., "My Plugin" -> "com.example.myplugin")
-            plugin_name = defaults["name"].lower().replace(" ", "")
-            defaults["plugin_id"] = f"com.example.{plugin_name}"
-
         return defaults
 
     def list_templates(self) -> list[str]:
         """Get list of available templates"""
-        return list(self.templates.keys())
+        return list(self._factories)
 
     def get_template_info(self, template_name: str) -> dict[str, str] | None:
         """Get information about a template"""
-        if template_name not in self.templates:
+        template = self._get_template(template_name)
+        if template is None:
             return None
 
-        template = self.templates[template_name]
         return {"name": template.name, "description": template.description}
 
 
@@ -1060,7 +442,7 @@ def main() -> int:
     # Generate command
     generate_parser = subparsers.add_parser("generate", help="Generate a new plugin")
     generate_parser.add_argument(
-        "template", choices=["native", "python"], help="Plugin template to use"
+        "template", choices=list(PLUGIN_TEMPLATES), help="Plugin template to use"
     )
     generate_parser.add_argument("name", help="Plugin name")
     generate_parser.add_argument(
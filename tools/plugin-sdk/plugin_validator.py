@@ -6,15 +6,123 @@ A comprehensive tool for validating plugin projects, metadata, and interfaces.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import mmap
+import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
+
+# Parse metadata.json with orjson when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Markers searched for in C++ headers and Python sources
+CPP_NEEDLES = (b"IPlugin", b"IDynamicPlugin", b"Q_OBJECT", b"Q_INTERFACES")
+PLUGIN_INTERFACE_NEEDLES = frozenset({b"IPlugin", b"IDynamicPlugin"})
+PYTHON_NEEDLES = (b"def initialize", b"def shutdown", b"def execute_command")
+REQUIRED_INCLUDES = (b"qtplugin/interfaces/core/plugin_interface.hpp", b"QObject")
+CMAKE_NEEDLES = (
+    "cmake_minimum_required",
+    "project",
+    "add_library",
+    "find_package(Qt6",
+    "QtForge",
+    ".qtplugin",
+)
+
+# Source trees at least this large are scanned on a thread pool
+_PARALLEL_SCAN_MIN_FILES = 8
+
+# Result severities, most severe first; unknown severities count as errors
+SEVERITY_LEVELS = {"error": 0, "warning": 1, "info": 2}
+
+# Plugin and interface ids use lowercase dot notation
+_ID_RE = re.compile(r"^[a-z0-9]+(\.[a-z0-9]+)*$")
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+)?$")
+# PEP 263 encoding declaration, matched against raw source bytes
+_ENCODING_RE = re.compile(rb"#.*coding[:=]\s*([-\w.]+)")
+# Every CMake needle in one pass; the lookahead also reports overlapping needles
+_CMAKE_RE = re.compile(
+    "(?=(" + "|".join(re.escape(needle) for needle in CMAKE_NEEDLES) + "))"
+)
+
+
+@contextlib.contextmanager
+def _open_source(path: Path) -> Iterator[mmap.mmap | bytes]:
+    """Map a source file read-only for byte searches
+
+    The checks only look for ASCII markers, so files are searched as raw
+    bytes instead of being decoded. Files that cannot be mapped (such as
+    empty ones) are read instead.
+    """
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            data = None
+        if data is None:
+            yield f.read()
+        else:
+            with data:
+                yield data
+
+
+def _find_needles(content: mmap.mmap | bytes, needles: tuple[bytes, ...]) -> set[bytes]:
+    """Return the needles that occur in content"""
+    return {needle for needle in needles if content.find(needle) != -1}
+
+
+def _scan_cpp_file(
+    path: Path, needles: tuple[bytes, ...]
+) -> tuple[set[bytes], bytes | None]:
+    """Return the needles found in a C++ file and its first required include"""
+    with _open_source(path) as content:
+        hits = _find_needles(content, needles)
+        for include in REQUIRED_INCLUDES:
+            if content.find(include) != -1:
+                return hits, include
+    return hits, None
+
+
+def _parse_json(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, preferring orjson when it is installed
+
+    Anything orjson rejects is re-parsed by the json module, which keeps
+    its error messages and the inputs only it accepts (such as NaN).
+    """
+    # Decode up front: json.loads() on bytes would also accept a BOM or UTF-16
+    data = raw.decode("utf-8")
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _first_lines(content: mmap.mmap | bytes, count: int) -> bytes:
+    """Return the first count lines of content"""
+    end = -1
+    for _ in range(count):
+        end = content.find(b"\n", end + 1)
+        if end == -1:
+            return content[:]
+    return content[:end]
 
 
 class ValidationResult:
     """Represents the result of a validation check"""
 
+    __slots__ = ("check_name", "passed", "message", "severity")
+
     def __init__(
         self, check_name: str, passed: bool, message: str, severity: str = "error"
     ) -> None:
@@ -31,27 +139,47 @@ class ValidationResult:
 class PluginValidator:
     """Main plugin validator class"""
 
-    def __init__(self) -> None:
+    def __init__(self, min_severity: str = "info", quiet: bool = False) -> None:
+        """Keep results up to min_severity; with quiet, keep only failures
+
+        passed, failed and failed_errors count every check, including
+        unkept results.
+        """
         self.results: list[ValidationResult] = []
+        self.passed = 0
+        self.failed = 0
+        self.failed_errors = 0
+        self._min_level = SEVERITY_LEVELS[min_severity]
+        self._quiet = quiet
+        self._metadata: Any = None
+        self._metadata_error: Exception | None = None
 
     def validate_plugin(self, plugin_path: Path) -> list[ValidationResult]:
         """Validate a plugin project"""
         self.results = []
+        self.passed = 0
+        self.failed = 0
+        self.failed_errors = 0
+
+        # Walk the plugin tree once; the checks below share the listing
+        tree = self._scan_tree(plugin_path)
 
         # Basic structure validation
-        self._validate_structure(plugin_path)
+        self._validate_structure(plugin_path, tree)
 
-        # Metadata validation
-        self._validate_metadata(plugin_path)
+        # Metadata validation; metadata.json is parsed once for both the
+        # metadata and the interface checks
+        self._load_metadata(tree)
+        self._validate_metadata(tree)
 
         # Source code validation
-        self._validate_source_code(plugin_path)
+        self._validate_source_code(tree)
 
         # CMake validation (for native plugins)
-        self._validate_cmake(plugin_path)
+        self._validate_cmake(tree)
 
         # Interface validation
-        self._validate_interfaces(plugin_path)
+        self._validate_interfaces(tree)
 
         return self.results
 
@@ -59,10 +187,53 @@ class PluginValidator:
         self, check_name: str, passed: bool, message: str, severity: str = "error"
     ) -> None:
         """Add a validation result"""
+        if passed:
+            self.passed += 1
+        else:
+            self.failed += 1
+            if severity == "error":
+                self.failed_errors += 1
+
+        # Filtered-out results are counted but never created
+        if passed and self._quiet:
+            return
+        if SEVERITY_LEVELS.get(severity, 0) > self._min_level:
+            return
+
         result = ValidationResult(check_name, passed, message, severity)
         self.results.append(result)
 
-    def _validate_structure(self, plugin_path: Path) -> None:
+    @staticmethod
+    def _scan_tree(plugin_path: Path) -> dict[str, Any]:
+        """Walk the plugin directory once and bucket its source files"""
+        tree: dict[str, Any] = {
+            "cpp": [],
+            "hpp": [],
+            "py": [],
+            "has_src": False,
+            "has_include": False,
+            "metadata": None,
+            "cmake": None,
+        }
+        for dirpath, dirnames, filenames in os.walk(plugin_path):
+            root = Path(dirpath)
+            if dirpath == str(plugin_path):
+                tree["has_src"] = "src" in dirnames
+                tree["has_include"] = "include" in dirnames
+                if "metadata.json" in filenames:
+                    tree["metadata"] = root / "metadata.json"
+                if "CMakeLists.txt" in filenames:
+                    tree["cmake"] = root / "CMakeLists.txt"
+            for name in filenames:
+                if name.endswith(".cpp"):
+                    tree["cpp"].append(root / name)
+                elif name.endswith(".hpp"):
+                    tree["hpp"].append(root / name)
+                elif name.endswith(".py"):
+                    tree["py"].append(root / name)
+        return tree
+
+    def _validate_structure(self, plugin_path: Path, tree: dict[str, Any]) -> None:
         """Validate plugin directory structure"""
         # Check if directory exists
         if not plugin_path.exists():
@@ -82,32 +253,24 @@ class PluginValidator:
         self._add_result("Directory Exists", True, "Plugin directory exists")
 
         # Check for metadata.json
-        metadata_file = plugin_path / "metadata.json"
-        if metadata_file.exists():
+        if tree["metadata"] is not None:
             self._add_result("Metadata File", True, "metadata.json found")
         else:
             self._add_result("Metadata File", False, "metadata.json not found")
 
         # Check for source files
-        has_cpp_files = any(plugin_path.glob("**/*.cpp"))
-        has_hpp_files = any(plugin_path.glob("**/*.hpp"))
-        has_py_files = any(plugin_path.glob("**/*.py"))
-
-        if has_cpp_files or has_hpp_files:
+        if tree["cpp"] or tree["hpp"]:
             self._add_result("Source Files", True, "C++ source files found")
 
             # Check for typical C++ structure
-            src_dir = plugin_path / "src"
-            include_dir = plugin_path / "include"
-
-            if src_dir.exists():
+            if tree["has_src"]:
                 self._add_result("Source Directory", True, "src/ directory found")
             else:
                 self._add_result(
                     "Source Directory", False, "src/ directory not found", "warning"
                 )
 
-            if include_dir.exists():
+            if tree["has_include"]:
                 self._add_result("Include Directory", True, "include/ directory found")
             else:
                 self._add_result(
@@ -117,24 +280,39 @@ class PluginValidator:
                     "warning",
                 )
 
-        elif has_py_files:
+        elif tree["py"]:
             self._add_result("Source Files", True, "Python source files found")
         else:
             self._add_result("Source Files", False, "No source files found")
 
-    def _validate_metadata(self, plugin_path: Path) -> None:
-        """Validate plugin metadata"""
-        metadata_file = plugin_path / "metadata.json"
+    def _load_metadata(self, tree: dict[str, Any]) -> None:
+        """Parse metadata.json and report whether it is valid JSON"""
+        self._metadata = None
+        self._metadata_error = None
+        metadata_file = tree["metadata"]
 
-        if not metadata_file.exists():
+        if metadata_file is None:
             return  # Already reported in structure validation
 
         try:
-            with open(metadata_file, encoding="utf-8") as f:
-                metadata = json.load(f)
-
+            self._metadata = _parse_json(metadata_file.read_bytes())
+        except json.JSONDecodeError as e:
+            self._metadata_error = e
+            self._add_result("Metadata Parse", False, f"Invalid JSON: {e}")
+        except Exception as e:
+            self._metadata_error = e
+            self._add_result("Metadata Parse", False, f"Error reading metadata: {e}")
+        else:
             self._add_result("Metadata Parse", True, "metadata.json is valid JSON")
 
+    def _validate_metadata(self, tree: dict[str, Any]) -> None:
+        """Validate plugin metadata"""
+        if tree["metadata"] is None or self._metadata_error is not None:
+            return  # Already reported by _load_metadata
+
+        metadata = self._metadata
+        try:
+
             # Check required fields
             required_fields = ["id", "name", "version", "description", "author"]
             for field in required_fields:
@@ -152,7 +330,7 @@ class PluginValidator:
             # Validate plugin ID format
             if "id" in metadata:
                 plugin_id = metadata["id"]
-                if re.match(r"^[a-z0-9]+(\.[a-z0-9]+)*$", plugin_id):
+                if _ID_RE.match(plugin_id):
                     self._add_result(
                         "Plugin ID Format", True, "Plugin ID format is valid"
                     )
@@ -166,7 +344,7 @@ class PluginValidator:
             # Validate version format
             if "version" in metadata:
                 version = metadata["version"]
-                if re.match(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+)?$", version):
+                if _SEMVER_RE.match(version):
                     self._add_result("Version Format", True, "Version format is valid")
                 else:
                     self._add_result(
@@ -220,17 +398,14 @@ class PluginValidator:
                             f"Interface {i + 1}", False, "Interface is not an object"
                         )
 
-        except json.JSONDecodeError as e:
-            self._add_result("Metadata Parse", False, f"Invalid JSON: {e}")
         except Exception as e:
             self._add_result("Metadata Parse", False, f"Error reading metadata: {e}")
 
-    def _validate_source_code(self, plugin_path: Path) -> None:
+    def _validate_source_code(self, tree: dict[str, Any]) -> None:
         """Validate source code"""
-        # Find source files
-        cpp_files = list(plugin_path.glob("**/*.cpp"))
-        hpp_files = list(plugin_path.glob("**/*.hpp"))
-        py_files = list(plugin_path.glob("**/*.py"))
+        cpp_files = tree["cpp"]
+        hpp_files = tree["hpp"]
+        py_files = tree["py"]
 
         if cpp_files or hpp_files:
             self._validate_cpp_code(cpp_files, hpp_files)
@@ -240,30 +415,58 @@ class PluginValidator:
 
     def _validate_cpp_code(self, cpp_files: list[Path], hpp_files: list[Path]) -> None:
         """Validate C++ source code"""
-        # Check for plugin interface implementation
-        found_plugin_interface = False
-        found_q_object = False
-        found_q_interfaces = False
+        # Markers not seen yet; once all are found, headers are only searched
+        # for includes
+        remaining = set(CPP_NEEDLES)
+        found: set[bytes] = set()
+        # Include hits, reported after the marker results
+        found_includes: list[tuple[bytes, str]] = []
+
+        sources = [(path, False) for path in cpp_files]
+        sources += [(path, True) for path in hpp_files]
+
+        # Large trees are scanned on worker threads, each header for every
+        # marker; the results are still merged here, in file order
+        parallel = len(sources) >= _PARALLEL_SCAN_MIN_FILES
+        if parallel:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+                futures = [
+                    pool.submit(
+                        _scan_cpp_file, source_file, CPP_NEEDLES if is_header else ()
+                    )
+                    for source_file, is_header in sources
+                ]
 
-        for hpp_file in hpp_files:
+        # Open each file once for both the marker and the include checks
+        for i, (source_file, is_header) in enumerate(sources):
             try:
-                content = hpp_file.read_text(encoding="utf-8")
+                if parallel:
+                    hits, include = futures[i].result()
+                else:
+                    needles = tuple(remaining) if is_header else ()
+                    hits, include = _scan_cpp_file(source_file, needles)
+            except Exception as e:
+                if is_header:
+                    self._add_result(
+                        "Source Code Read", False, f"Error reading {source_file}: {e}"
+                    )
+                continue
 
-                # Check for plugin interface
-                if "IPlugin" in content or "IDynamicPlugin" in content:
-                    found_plugin_interface = True
+            if hits & PLUGIN_INTERFACE_NEEDLES:
+                # Either interface satisfies the check
+                hits |= PLUGIN_INTERFACE_NEEDLES
+            found |= hits
+            remaining -= hits
 
-                # Check for Qt plugin macros
-                if "Q_OBJECT" in content:
-                    found_q_object = True
+            if include is not None:
+                found_includes.append((include, source_file.name))
 
-                if "Q_INTERFACES" in content:
-                    found_q_interfaces = True
+        # Check for plugin interface
+        found_plugin_interface = bool(found & PLUGIN_INTERFACE_NEEDLES)
 
-            except Exception as e:
-                self._add_result(
-                    "Source Code Read", False, f"Error reading {hpp_file}: {e}"
-                )
+        # Check for Qt plugin macros
+        found_q_object = b"Q_OBJECT" in found
+        found_q_interfaces = b"Q_INTERFACES" in found
 
         if found_plugin_interface:
             self._add_result(
@@ -287,20 +490,12 @@ class PluginValidator:
             )
 
         # Check for proper includes
-        required_includes = ["qtplugin/interfaces/core/plugin_interface.hpp", "QObject"]
-        for cpp_file in cpp_files + hpp_files:
-            try:
-                content = cpp_file.read_text(encoding="utf-8")
-                for include in required_includes:
-                    if include in content:
-                        self._add_result(
-                            f"Include {include}",
-                            True,
-                            f"Required include found in {cpp_file.name}",
-                        )
-                        break
-            except Exception:
-                pass
+        for include, file_name in found_includes:
+            self._add_result(
+                f"Include {include.decode()}",
+                True,
+                f"Required include found in {file_name}",
+            )
 
     def _validate_python_code(self, py_files: list[Path]) -> None:
         """Validate Python source code"""
@@ -308,15 +503,12 @@ class PluginValidator:
 
         for py_file in py_files:
             try:
-                content = py_file.read_text(encoding="utf-8")
+                with _open_source(py_file) as content:
+                    found = _find_needles(content, PYTHON_NEEDLES)
+                    first_two_lines = _first_lines(content, 2)
 
                 # Check for plugin class methods
-                required_methods = ["initialize", "shutdown", "execute_command"]
-                method_count = sum(
-                    1 for method in required_methods if f"def {method}" in content
-                )
-
-                if method_count >= len(required_methods):
+                if len(found) == len(PYTHON_NEEDLES):
                     found_plugin_class = True
                     self._add_result(
                         "Plugin Methods",
@@ -325,8 +517,7 @@ class PluginValidator:
                     )
 
                 # Check for encoding declaration in the first two lines
-                first_two_lines = "\n".join(content.splitlines()[:2])
-                if re.search(r"#.*coding[:=]\s*([-\w.]+)", first_two_lines):
+                if _ENCODING_RE.search(first_two_lines):
                     self._add_result(
                         "File Encoding",
                         True,
@@ -343,11 +534,11 @@ class PluginValidator:
                 "Plugin Class", False, "No plugin class with required methods found"
             )
 
-    def _validate_cmake(self, plugin_path: Path) -> None:
+    def _validate_cmake(self, tree: dict[str, Any]) -> None:
         """Validate CMakeLists.txt"""
-        cmake_file = plugin_path / "CMakeLists.txt"
+        cmake_file = tree["cmake"]
 
-        if not cmake_file.exists():
+        if cmake_file is None:
             self._add_result(
                 "CMakeLists.txt", False, "CMakeLists.txt not found", "warning"
             )
@@ -355,24 +546,25 @@ class PluginValidator:
 
         try:
             content = cmake_file.read_text(encoding="utf-8")
+            found = {match.group(1) for match in _CMAKE_RE.finditer(content)}
 
             # Check for required CMake commands
             required_commands = ["cmake_minimum_required", "project", "add_library"]
             for command in required_commands:
-                if command in content:
+                if command in found:
                     self._add_result(f"CMake {command}", True, f"{command} found")
                 else:
                     self._add_result(f"CMake {command}", False, f"{command} not found")
 
             # Check for Qt and QtForge dependencies
-            if "find_package(Qt6" in content:
+            if "find_package(Qt6" in found:
                 self._add_result("Qt Dependency", True, "Qt6 dependency found")
             else:
                 self._add_result(
                     "Qt Dependency", False, "Qt6 dependency not found", "warning"
                 )
 
-            if "QtForge" in content:
+            if "QtForge" in found:
                 self._add_result("QtForge Dependency", True, "QtForge dependency found")
             else:
                 self._add_result(
@@ -383,7 +575,7 @@ class PluginValidator:
                 )
 
             # Check for plugin-specific settings
-            if ".qtplugin" in content:
+            if ".qtplugin" in found:
                 self._add_result(
                     "Plugin Extension", True, "Plugin file extension configured"
                 )
@@ -400,17 +592,21 @@ class PluginValidator:
                 "CMakeLists.txt Read", False, f"Error reading CMakeLists.txt: {e}"
             )
 
-    def _validate_interfaces(self, plugin_path: Path) -> None:
+    def _validate_interfaces(self, tree: dict[str, Any]) -> None:
         """Validate plugin interfaces"""
-        metadata_file = plugin_path / "metadata.json"
+        if tree["metadata"] is None:
+            return
 
-        if not metadata_file.exists():
+        if self._metadata_error is not None:
+            self._add_result(
+                "Interface Validation",
+                False,
+                f"Error validating interfaces: {self._metadata_error}",
+            )
             return
 
+        metadata = self._metadata
         try:
-            with open(metadata_file, encoding="utf-8") as f:
-                metadata = json.load(f)
-
             if "interfaces" not in metadata:
                 self._add_result(
                     "Interface Definition",
@@ -451,7 +647,7 @@ class PluginValidator:
                 # Validate interface ID format
                 if "id" in interface:
                     interface_id = interface["id"]
-                    if re.match(r"^[a-z0-9]+(\.[a-z0-9]+)*$", interface_id):
+                    if _ID_RE.match(interface_id):
                         self._add_result(
                             f"Interface {i + 1} ID Format",
                             True,
@@ -486,6 +682,37 @@ class PluginValidator:
             )
 
 
+def _write_json_report(
+    plugin_path: Path,
+    total_checks: int,
+    passed_checks: int,
+    failed_checks: int,
+    results: Iterable[ValidationResult],
+) -> None:
+    """Write the JSON report to stdout as it is encoded
+
+    iterencode() yields the document in chunks, so the whole string is
+    never built in memory.
+    """
+    report = {
+        "plugin_path": str(plugin_path),
+        "total_checks": total_checks,
+        "passed_checks": passed_checks,
+        "failed_checks": failed_checks,
+        "results": [
+            {
+                "check_name": r.check_name,
+                "passed": r.passed,
+                "message": r.message,
+                "severity": r.severity,
+            }
+            for r in results
+        ],
+    }
+    sys.stdout.writelines(json.JSONEncoder(indent=2).iterencode(report))
+    sys.stdout.write("\n")
+
+
 def main() -> int:
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -508,53 +735,35 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    validator = PluginValidator()
+    # Results below the requested severity (or passing ones, with --quiet)
+    # are dropped as the checks run
+    validator = PluginValidator(args.severity, args.quiet)
     results = validator.validate_plugin(args.plugin_path)
-
-    # Filter results by severity
-    severity_levels = {"error": 0, "warning": 1, "info": 2}
-    min_level = severity_levels[args.severity]
-
-    filtered_results = [
-        result
-        for result in results
-        if severity_levels.get(result.severity, 0) <= min_level
-    ]
-
-    if args.quiet:
-        filtered_results = [result for result in filtered_results if not result.passed]
+    total_checks = validator.passed + validator.failed
 
     # Output results
     if args.format == "json":
-        output = {
-            "plugin_path": str(args.plugin_path),
-            "total_checks": len(results),
-            "passed_checks": sum(1 for r in results if r.passed),
-            "failed_checks": sum(1 for r in results if not r.passed),
-            "results": [
-                {
-                    "check_name": r.check_name,
-                    "passed": r.passed,
-                    "message": r.message,
-                    "severity": r.severity,
-                }
-                for r in filtered_results
-            ],
-        }
-        print(json.dumps(output, indent=2))
+        _write_json_report(
+            args.plugin_path,
+            total_checks,
+            validator.passed,
+            validator.failed,
+            results,
+        )
     else:
-        print(f"🔍 Validating plugin: {args.plugin_path}")
-        print(f"📊 Total checks: {len(results)}")
-        print(f"✅ Passed: {sum(1 for r in results if r.passed)}")
-        print(f"❌ Failed: {sum(1 for r in results if not r.passed)}")
-        print()
-
-        for result in filtered_results:
-            print(result)
+        # The whole report goes out in a single write
+        lines = [
+            f"🔍 Validating plugin: {args.plugin_path}",
+            f"📊 Total checks: {total_checks}",
+            f"✅ Passed: {validator.passed}",
+            f"❌ Failed: {validator.failed}",
+            "",
+        ]
+        lines.extend(map(str, results))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Return exit code based on validation results
-    failed_errors = sum(1 for r in results if not r.passed and r.severity == "error")
-    return 1 if failed_errors > 0 else 0
+    return 1 if validator.failed_errors > 0 else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+cmake_minimum_required(VERSION 3.21)
+project({{project_name}} VERSION {{version}} LANGUAGES CXX)
+
+# Set C++20 standard
+set(CMAKE_CXX_STANDARD 20)
+set(CMAKE_CXX_STANDARD_REQUIRED ON)
+
+# Find required packages
+find_package(Qt6 REQUIRED COMPONENTS Core)
+find_package(QtForge REQUIRED COMPONENTS Core)
+
+# Create the plugin
+add_library({{target_name}} MODULE
+    src/{{class_name_lower}}.cpp
+    include/{{class_name_lower}}.hpp
+)
+
+# Set plugin properties
+set_target_properties({{target_name}} PROPERTIES
+    PREFIX ""
+    SUFFIX ".qtplugin"
+    AUTOMOC ON
+    OUTPUT_NAME {{plugin_name}}
+)
+
+# Link libraries
+target_link_libraries({{target_name}}
+    PRIVATE
+        Qt6::Core
+        QtForge::Core
+)
+
+# Include directories
+target_include_directories({{target_name}}
+    PRIVATE
+        include
+)
+
+# Install plugin
+install(TARGETS {{target_name}}
+    LIBRARY DESTINATION plugins
+)
+
+# Install metadata
+install(FILES metadata.json
+    DESTINATION plugins
+    RENAME {{plugin_name}}.json
+)
+
+# Tests (optional)
+if(BUILD_TESTING)
+    find_package(Qt6 REQUIRED COMPONENTS Test)
+
+    add_executable({{target_name}}_test
+        tests/test_{{class_name_lower}}.cpp
+        src/{{class_name_lower}}.cpp
+    )
+
+    target_link_libraries({{target_name}}_test
+        PRIVATE
+            Qt6::Core
+            Qt6::Test
+            QtForge::Core
+    )
+
+    target_include_directories({{target_name}}_test
+        PRIVATE
+            include
+    )
+
+    add_test(NAME {{target_name}}_test COMMAND {{target_name}}_test)
+endif()
@@ -0,0 +1,91 @@
+/**
+ * @file {{class_name_lower}}.hpp
+ * @brief {{description}}
+ * @version {{version}}
+ * @author {{author}}
+ */
+
+#pragma once
+
+#include <qtplugin/interfaces/core/dynamic_plugin_interface.hpp>
+#include <QObject>
+#include <QString>
+#include <QJsonObject>
+#include <memory>
+#include <string_view>
+#include <unordered_map>
+
+class {{class_name}} : public QObject, public qtplugin::IDynamicPlugin {
+    Q_OBJECT
+    Q_PLUGIN_METADATA(IID "qtplugin.IDynamicPlugin/{{version}}" FILE "metadata.json")
+    Q_INTERFACES(qtplugin::IDynamicPlugin)
+
+public:
+    explicit {{class_name}}(QObject* parent = nullptr);
+    ~{{class_name}}() override;
+
+    // === Compile-time Metadata ===
+    static constexpr std::string_view k_name = "{{name}}";
+    static constexpr std::string_view k_description = "{{description}}";
+    static constexpr std::string_view k_author = "{{author}}";
+    static constexpr std::string_view k_id = "{{plugin_id}}";
+
+    // === IPlugin Implementation ===
+    std::string_view name() const noexcept override;
+    std::string_view description() const noexcept override;
+    qtplugin::Version version() const noexcept override;
+    std::string_view author() const noexcept override;
+    std::string id() const noexcept override;
+
+    qtplugin::expected<void, qtplugin::PluginError> initialize() override;
+    void shutdown() noexcept override;
+    qtplugin::PluginState state() const noexcept override;
+
+    qtplugin::PluginCapabilities capabilities() const noexcept override;
+
+    qtplugin::expected<void, qtplugin::PluginError> configure(
+        const QJsonObject& config) override;
+    QJsonObject current_configuration() const override;
+
+    qtplugin::expected<QJsonObject, qtplugin::PluginError> execute_command(
+        std::string_view command, const QJsonObject& params = {}) override;
+    std::vector<std::string> available_commands() const override;
+
+    // === IDynamicPlugin Implementation ===
+    std::vector<qtplugin::InterfaceDescriptor> get_interface_descriptors() const override;
+    bool supports_interface(const QString& interface_id,
+                           const qtplugin::Version& min_version = qtplugin::Version{}) const override;
+    std::optional<qtplugin::InterfaceDescriptor> get_interface_descriptor(
+        const QString& interface_id) const override;
+
+    qtplugin::expected<void, qtplugin::PluginError> adapt_to_interface(
+        const QString& interface_id, const qtplugin::Version& target_version) override;
+
+    qtplugin::PluginType get_plugin_type() const override;
+    qtplugin::PluginExecutionContext get_execution_context() const override;
+
+    qtplugin::expected<QVariant, qtplugin::PluginError> execute_code(
+        const QString& code, const QJsonObject& context = {}) override;
+
+    qtplugin::expected<QVariant, qtplugin::PluginError> invoke_method(
+        const QString& method_name, const QVariantList& parameters = {},
+        const QString& interface_id = {}) override;
+
+private:
+    qtplugin::PluginState m_state{qtplugin::PluginState::Unloaded};
+    QJsonObject m_configuration;
+    std::vector<qtplugin::InterfaceDescriptor> m_interfaces;
+    // Position of each interface in m_interfaces, keyed by interface id
+    std::unordered_map<QString, size_t> m_interface_index;
+
+    void add_interface(const qtplugin::InterfaceDescriptor& interface);
+    void setup_interfaces();
+
+    // === Commands ===
+    using CommandHandler = qtplugin::expected<QJsonObject, qtplugin::PluginError> (
+        {{class_name}}::*)(const QJsonObject& params);
+    static const std::unordered_map<std::string_view, CommandHandler>& commands();
+
+    qtplugin::expected<QJsonObject, qtplugin::PluginError> cmd_status(
+        const QJsonObject& params);
+};
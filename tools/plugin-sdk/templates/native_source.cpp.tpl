@@ -0,0 +1,216 @@
+/**
+ * @file {{class_name_lower}}.cpp
+ * @brief Implementation of {{class_name}}
+ * @version {{version}}
+ */
+
+#include "../include/{{class_name_lower}}.hpp"
+#include <QDebug>
+#include <QLoggingCategory>
+#include <format>
+
+Q_LOGGING_CATEGORY({{class_name_lower}}Log, "{{plugin_id}}")
+
+{{class_name}}::{{class_name}}(QObject* parent)
+    : QObject(parent) {
+    setup_interfaces();
+}
+
+{{class_name}}::~{{class_name}}() {
+    if (m_state != qtplugin::PluginState::Unloaded) {
+        shutdown();
+    }
+}
+
+std::string_view {{class_name}}::name() const noexcept {
+    return k_name;
+}
+
+std::string_view {{class_name}}::description() const noexcept {
+    return k_description;
+}
+
+qtplugin::Version {{class_name}}::version() const noexcept {
+    return qtplugin::Version::from_string("{{version}}").value_or(qtplugin::Version{});
+}
+
+std::string_view {{class_name}}::author() const noexcept {
+    return k_author;
+}
+
+std::string {{class_name}}::id() const noexcept {
+    return std::string(k_id);
+}
+
+qtplugin::expected<void, qtplugin::PluginError> {{class_name}}::initialize() {
+    if (m_state != qtplugin::PluginState::Unloaded) {
+        return qtplugin::make_error<void>(qtplugin::PluginErrorCode::InvalidState,
+                                         "Plugin already initialized");
+    }
+
+    m_state = qtplugin::PluginState::Loading;
+
+    // TODO: Add your initialization code here
+
+    m_state = qtplugin::PluginState::Running;
+    qCDebug({{class_name_lower}}Log) << "Plugin initialized successfully";
+
+    return qtplugin::make_success();
+}
+
+void {{class_name}}::shutdown() noexcept {
+    if (m_state == qtplugin::PluginState::Unloaded) {
+        return;
+    }
+
+    m_state = qtplugin::PluginState::Stopping;
+
+    // TODO: Add your cleanup code here
+
+    m_state = qtplugin::PluginState::Unloaded;
+    qCDebug({{class_name_lower}}Log) << "Plugin shutdown completed";
+}
+
+qtplugin::PluginState {{class_name}}::state() const noexcept {
+    return m_state;
+}
+
+qtplugin::PluginCapabilities {{class_name}}::capabilities() const noexcept {
+    return qtplugin::PluginCapability::{{capability}};
+}
+
+qtplugin::expected<void, qtplugin::PluginError> {{class_name}}::configure(
+    const QJsonObject& config) {
+
+    m_configuration = config;
+
+    // TODO: Process configuration
+
+    return qtplugin::make_success();
+}
+
+QJsonObject {{class_name}}::current_configuration() const {
+    return m_configuration;
+}
+
+qtplugin::expected<QJsonObject, qtplugin::PluginError> {{class_name}}::execute_command(
+    std::string_view command, const QJsonObject& params) {
+
+    const auto& handlers = commands();
+    auto it = handlers.find(command);
+    if (it != handlers.end()) {
+        return (this->*(it->second))(params);
+    }
+
+    return qtplugin::make_error<QJsonObject>(qtplugin::PluginErrorCode::CommandNotFound,
+                                            std::format("Unknown command: {}", command));
+}
+
+std::vector<std::string> {{class_name}}::available_commands() const {
+    const auto& handlers = commands();
+    std::vector<std::string> result;
+    result.reserve(handlers.size());
+    for (const auto& [command, handler] : handlers) {
+        result.emplace_back(command);
+    }
+    return result;
+}
+
+const std::unordered_map<std::string_view, {{class_name}}::CommandHandler>&
+{{class_name}}::commands() {
+    // TODO: Register your commands here
+    static const std::unordered_map<std::string_view, CommandHandler> s_commands = {
+        {"status", &{{class_name}}::cmd_status},
+    };
+    return s_commands;
+}
+
+qtplugin::expected<QJsonObject, qtplugin::PluginError> {{class_name}}::cmd_status(
+    const QJsonObject& params) {
+
+    Q_UNUSED(params)
+
+    QJsonObject result;
+    result["state"] = static_cast<int>(m_state);
+    result["name"] = QString::fromStdString(std::string(name()));
+    return result;
+}
+
+// === IDynamicPlugin Implementation ===
+
+std::vector<qtplugin::InterfaceDescriptor> {{class_name}}::get_interface_descriptors() const {
+    return m_interfaces;
+}
+
+bool {{class_name}}::supports_interface(const QString& interface_id,
+                                       const qtplugin::Version& min_version) const {
+    auto it = m_interface_index.find(interface_id);
+    return it != m_interface_index.end() &&
+           m_interfaces[it->second].version >= min_version;
+}
+
+std::optional<qtplugin::InterfaceDescriptor> {{class_name}}::get_interface_descriptor(
+    const QString& interface_id) const {
+
+    auto it = m_interface_index.find(interface_id);
+    if (it == m_interface_index.end()) {
+        return std::nullopt;
+    }
+    return m_interfaces[it->second];
+}
+
+qtplugin::expected<void, qtplugin::PluginError> {{class_name}}::adapt_to_interface(
+    const QString& interface_id, const qtplugin::Version& target_version) {
+
+    // TODO: Implement interface adaptation logic
+    return qtplugin::make_success();
+}
+
+qtplugin::PluginType {{class_name}}::get_plugin_type() const {
+    return qtplugin::PluginType::Native;
+}
+
+qtplugin::PluginExecutionContext {{class_name}}::get_execution_context() const {
+    return qtplugin::PluginTypeUtils::get_default_context(qtplugin::PluginType::Native);
+}
+
+qtplugin::expected<QVariant, qtplugin::PluginError> {{class_name}}::execute_code(
+    const QString& code, const QJsonObject& context) {
+
+    Q_UNUSED(code)
+    Q_UNUSED(context)
+
+    return qtplugin::make_error<QVariant>(qtplugin::PluginErrorCode::NotSupported,
+                                         "Code execution not supported for native plugins");
+}
+
+qtplugin::expected<QVariant, qtplugin::PluginError> {{class_name}}::invoke_method(
+    const QString& method_name, const QVariantList& parameters,
+    const QString& interface_id) {
+
+    Q_UNUSED(method_name)
+    Q_UNUSED(parameters)
+    Q_UNUSED(interface_id)
+
+    // TODO: Implement dynamic method invocation
+    return qtplugin::make_error<QVariant>(qtplugin::PluginErrorCode::CommandNotFound,
+                                         std::format("Method not found: {}",
+                                                     method_name.toStdString()));
+}
+
+void {{class_name}}::add_interface(const qtplugin::InterfaceDescriptor& interface) {
+    m_interface_index.emplace(interface.interface_id, m_interfaces.size());
+    m_interfaces.push_back(interface);
+}
+
+void {{class_name}}::setup_interfaces() {
+    // TODO: Define your plugin interfaces here
+    qtplugin::InterfaceDescriptor interface;
+    interface.interface_id = "{{plugin_id}}.main";
+    interface.version = version();
+    interface.description = QString::fromStdString(std::string(description()));
+
+    add_interface(interface);
+}
+
+#include "{{class_name_lower}}.moc"
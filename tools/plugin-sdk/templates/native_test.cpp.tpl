@@ -0,0 +1,70 @@
+/**
+ * @file test_{{class_name_lower}}.cpp
+ * @brief Unit tests for {{class_name}}
+ */
+
+#include <QtTest/QtTest>
+#include <QObject>
+#include "../include/{{class_name_lower}}.hpp"
+
+class Test{{class_name}} : public QObject {
+    Q_OBJECT
+
+private slots:
+    void initTestCase();
+    void cleanupTestCase();
+    void testInitialization();
+    void testCommands();
+    void testConfiguration();
+
+private:
+    std::unique_ptr<{{class_name}}> m_plugin;
+};
+
+void Test{{class_name}}::initTestCase() {
+    m_plugin = std::make_unique<{{class_name}}>();
+}
+
+void Test{{class_name}}::cleanupTestCase() {
+    m_plugin.reset();
+}
+
+void Test{{class_name}}::testInitialization() {
+    QCOMPARE(m_plugin->state(), qtplugin::PluginState::Unloaded);
+
+    auto result = m_plugin->initialize();
+    QVERIFY(result.has_value());
+    QCOMPARE(m_plugin->state(), qtplugin::PluginState::Running);
+
+    m_plugin->shutdown();
+    QCOMPARE(m_plugin->state(), qtplugin::PluginState::Unloaded);
+}
+
+void Test{{class_name}}::testCommands() {
+    m_plugin->initialize();
+
+    auto commands = m_plugin->available_commands();
+    QVERIFY(!commands.empty());
+    QVERIFY(std::find(commands.begin(), commands.end(), "status") != commands.end());
+
+    auto result = m_plugin->execute_command("status");
+    QVERIFY(result.has_value());
+
+    auto status = result.value();
+    QVERIFY(status.contains("state"));
+    QVERIFY(status.contains("name"));
+}
+
+void Test{{class_name}}::testConfiguration() {
+    QJsonObject config;
+    config["test_setting"] = "test_value";
+
+    auto result = m_plugin->configure(config);
+    QVERIFY(result.has_value());
+
+    auto current_config = m_plugin->current_configuration();
+    QCOMPARE(current_config["test_setting"].toString(), QString("test_value"));
+}
+
+QTEST_MAIN(Test{{class_name}})
+#include "test_{{class_name_lower}}.moc"
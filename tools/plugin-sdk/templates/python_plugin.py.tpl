@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+{{name}} - {{description}}
+Version: {{version}}
+Author: {{author}}
+"""
+
+import functools
+import json
+import logging
+import re
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("{{plugin_id}}")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_expression(code: str):
+    """Compile an expression for execute_code, reusing recent compilations
+
+    The cache is bounded so that a stream of distinct (possibly untrusted)
+    snippets cannot grow it without limit.
+    """
+    return compile(code, "<plugin-eval>", "eval")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_version(version: str) -> tuple:
+    """Parse a version such as "1.10.0" into a tuple for numeric comparison
+
+    Only the leading digits of each component count, so pre-release tags are
+    ignored. Trailing zeros are dropped so that "1.0" equals "1.0.0".
+    """
+    parts = []
+    for part in version.split("."):
+        match = re.match(r"\d+", part)
+        parts.append(int(match.group()) if match else 0)
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+class {{class_name}}:
+    """{{description}}"""
+
+    def __init__(self) -> None:
+        self.state = "unloaded"
+        self.configuration = {}
+        self.interfaces = []
+        # Interfaces keyed by interface_id, for constant-time lookups
+        self._interfaces_by_id = {}
+        self._setup_interfaces()
+
+    # === Plugin Interface ===
+
+    def name(self) -> str:
+        return "{{name}}"
+
+    def description(self) -> str:
+        return "{{description}}"
+
+    def version(self) -> str:
+        return "{{version}}"
+
+    def author(self) -> str:
+        return "{{author}}"
+
+    def id(self) -> str:
+        return "{{plugin_id}}"
+
+    def initialize(self) -> Dict[str, Any]:
+        """Initialize the plugin"""
+        if self.state != "unloaded":
+            return {"success": False, "error": "Plugin already initialized"}
+
+        self.state = "loading"
+
+        try:
+            # TODO: Add your initialization code here
+            logger.info(f"Initializing plugin {self.name()}")
+
+            self.state = "running"
+            logger.info("Plugin initialized successfully")
+            return {"success": True}
+
+        except Exception as e:
+            self.state = "error"
+            logger.error(f"Failed to initialize plugin: {e}")
+            return {"success": False, "error": str(e)}
+
+    def shutdown(self) -> Dict[str, Any]:
+        """Shutdown the plugin"""
+        if self.state == "unloaded":
+            return {"success": True}
+
+        self.state = "stopping"
+
+        try:
+            # TODO: Add your cleanup code here
+            logger.info("Shutting down plugin")
+
+            self.state = "unloaded"
+            logger.info("Plugin shutdown completed")
+            return {"success": True}
+
+        except Exception as e:
+            logger.error(f"Error during shutdown: {e}")
+            return {"success": False, "error": str(e)}
+
+    def get_state(self) -> str:
+        return self.state
+
+    def capabilities(self) -> List[str]:
+        return ["{{capability}}"]
+
+    def configure(self, config: dict[str, Any]) -> dict[str, Any]:
+        """Configure the plugin"""
+        try:
+            self.configuration.update(config)
+            # TODO: Process configuration
+            logger.info("Plugin configured successfully")
+            return {"success": True}
+        except Exception as e:
+            logger.error(f"Configuration failed: {e}")
+            return {"success": False, "error": str(e)}
+
+    def current_configuration(self) -> Dict[str, Any]:
+        return self.configuration.copy()
+
+    def execute_command(self, command: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Execute a plugin command"""
+        if params is None:
+            params = {}
+
+        if command == "status":
+            return {
+                "success": True,
+                "result": {
+                    "state": self.state,
+                    "name": self.name(),
+                    "version": self.version()
+                }
+            }
+
+        # TODO: Add your commands here
+
+        return {"success": False, "error": f"Unknown command: {command}"}
+
+    def available_commands(self) -> List[str]:
+        return ["status"]
+
+    # === Dynamic Plugin Interface ===
+
+    def get_interface_descriptors(self) -> List[Dict[str, Any]]:
+        """Get supported interface descriptors"""
+        return [interface for interface in self.interfaces]
+
+    def supports_interface(self, interface_id: str, min_version: str = "0.0.0") -> bool:
+        """Check if plugin supports a specific interface"""
+        interface = self._interfaces_by_id.get(interface_id)
+        return (interface is not None and
+                _parse_version(interface["version"]) >= _parse_version(min_version))
+
+    def get_interface_descriptor(self, interface_id: str) -> Optional[Dict[str, Any]]:
+        """Get interface descriptor by ID"""
+        return self._interfaces_by_id.get(interface_id)
+
+    def get_plugin_type(self) -> str:
+        return "python"
+
+    def get_execution_context(self) -> Dict[str, Any]:
+        return {
+            "type": "python",
+            "interpreter_path": "python",
+            "timeout": 60000
+        }
+
+    def execute_code(self, code: str, context: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Execute Python code in plugin context"""
+        if context is None:
+            context = {}
+
+        try:
+            # Create a safe execution environment
+            safe_globals = {
+                "__builtins__": {
+                    "print": print,
+                    "len": len,
+                    "str": str,
+                    "int": int,
+                    "float": float,
+                    "bool": bool,
+                    "list": list,
+                    "dict": dict,
+                    "tuple": tuple,
+                    "set": set,
+                }
+            }
+            safe_globals.update(context)
+
+            # Execute the code
+            result = eval(_compile_expression(code), safe_globals)
+            return {"success": True, "result": result}
+
+        except Exception as e:
+            logger.error(f"Code execution failed: {e}")
+            return {"success": False, "error": str(e)}
+
+    def invoke_method(self, method_name: str, parameters: list[Any] | None = None,
+                     interface_id: str = "") -> dict[str, Any]:
+        """Invoke a method dynamically"""
+        if parameters is None:
+            parameters = []
+
+        # Check if method exists
+        if hasattr(self, method_name):
+            try:
+                method = getattr(self, method_name)
+                if callable(method):
+                    result = method(*parameters)
+                    return {"success": True, "result": result}
+                else:
+                    return {"success": False, "error": f"{method_name} is not callable"}
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+        return {"success": False, "error": f"Method not found: {method_name}"}
+
+    def _setup_interfaces(self) -> None:
+        """Setup plugin interfaces"""
+        interface = {
+            "interface_id": f"{self.id()}.main",
+            "version": self.version(),
+            "description": self.description(),
+            "capabilities": [],
+            "schema": {},
+            "metadata": {}
+        }
+        self._add_interface(interface)
+
+    def _add_interface(self, interface: Dict[str, Any]) -> None:
+        """Register an interface descriptor"""
+        self.interfaces.append(interface)
+        # The first descriptor registered for an id wins
+        self._interfaces_by_id.setdefault(interface["interface_id"], interface)
+
+
+# Plugin entry point
+def create_plugin() -> None:
+    """Create and return plugin instance"""
+    return {{class_name}}()
+
+
+# For testing
+if __name__ == "__main__":
+    plugin = create_plugin()
+    print(f"Plugin: {plugin.name()} v{plugin.version()}")
+    print(f"Description: {plugin.description()}")
+
+    # Test initialization
+    result = plugin.initialize()
+    print(f"Initialize: {result}")
+
+    # Test command execution
+    status = plugin.execute_command("status")
+    print(f"Status: {status}")
+
+    # Test shutdown
+    shutdown_result = plugin.shutdown()
+    print(f"Shutdown: {shutdown_result}")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for {{class_name}}
+"""
+
+import unittest
+
+# The plugin directory is on sys.path when this file is run directly or
+# with unittest from that directory; under pytest, conftest.py adds it
+from {{plugin_name}} import {{class_name}}
+
+
+class Test{{class_name}}(unittest.TestCase):
+    """Test cases for {{class_name}}"""
+
+    def setUp(self) -> None:
+        """Set up test fixtures"""
+        self.plugin = {{class_name}}()
+
+    def tearDown(self) -> None:
+        """Clean up after tests"""
+        if self.plugin.get_state() != "unloaded":
+            self.plugin.shutdown()
+
+    def test_plugin_metadata(self) -> None:
+        """Test plugin metadata"""
+        self.assertEqual(self.plugin.name(), "{{name}}")
+        self.assertEqual(self.plugin.description(), "{{description}}")
+        self.assertEqual(self.plugin.version(), "{{version}}")
+        self.assertEqual(self.plugin.author(), "{{author}}")
+        self.assertEqual(self.plugin.id(), "{{plugin_id}}")
+
+    def test_initialization(self) -> None:
+        """Test plugin initialization"""
+        self.assertEqual(self.plugin.get_state(), "unloaded")
+
+        result = self.plugin.initialize()
+        self.assertTrue(result["success"])
+        self.assertEqual(self.plugin.get_state(), "running")
+
+        # Test double initialization
+        result = self.plugin.initialize()
+        self.assertFalse(result["success"])
+
+    def test_commands(self) -> None:
+        """Test command execution"""
+        self.plugin.initialize()
+
+        commands = self.plugin.available_commands()
+        self.assertIn("status", commands)
+
+        result = self.plugin.execute_command("status")
+        self.assertTrue(result["success"])
+        self.assertIn("result", result)
+        self.assertIn("state", result["result"])
+        self.assertIn("name", result["result"])
+
+    def test_configuration(self) -> None:
+        """Test plugin configuration"""
+        config = {"test_setting": "test_value"}
+        result = self.plugin.configure(config)
+        self.assertTrue(result["success"])
+
+        current_config = self.plugin.current_configuration()
+        self.assertEqual(current_config["test_setting"], "test_value")
+
+    def test_interfaces(self) -> None:
+        """Test interface support"""
+        interfaces = self.plugin.get_interface_descriptors()
+        self.assertGreater(len(interfaces), 0)
+
+        main_interface_id = f"{self.plugin.id()}.main"
+        self.assertTrue(self.plugin.supports_interface(main_interface_id))
+
+        descriptor = self.plugin.get_interface_descriptor(main_interface_id)
+        self.assertIsNotNone(descriptor)
+        self.assertEqual(descriptor["interface_id"], main_interface_id)
+
+    def test_code_execution(self) -> None:
+        """Test code execution"""
+        result = self.plugin.execute_code("2 + 2")
+        self.assertTrue(result["success"])
+        self.assertEqual(result["result"], 4)
+
+        # Test with context
+        context = {"x": 10}
+        result = self.plugin.execute_code("x * 2", context)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["result"], 20)
+
+    def test_method_invocation(self) -> None:
+        """Test dynamic method invocation"""
+        result = self.plugin.invoke_method("name")
+        self.assertTrue(result["success"])
+        self.assertEqual(result["result"], "{{name}}")
+
+        # Test non-existent method
+        result = self.plugin.invoke_method("non_existent_method")
+        self.assertFalse(result["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()